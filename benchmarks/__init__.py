@@ -0,0 +1 @@
+"""Benchmarks for the demographics app. Run modules with ``python -m benchmarks.<name>``."""
@@ -0,0 +1,119 @@
+"""Compare per-field build cost of the hand-written demographics form and schema-generated forms.
+
+Run from the repository root::
+
+    python -m benchmarks.form_build [--rounds 20]
+
+The reference is the original hand-written KV form (``benchmarks.legacy_form``).
+Exits non-zero if a field of the 40-field schema form costs more to build than
+a field of the reference form (within ``--tolerance``). Both forms are built
+under the same garbage-collector settings; ``--pause-gc`` disables the cyclic
+collector around every timed build to show how much of the cost is GC passes
+triggered by the widgets' allocations.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import os
+import sys
+import time
+from typing import Callable, List, Tuple
+
+from form_schema import CHOICE, MULTI, PHONE, TEXT, FieldSpec, FormSchema, compile_schema
+
+os.environ.setdefault("KIVY_NO_ARGS", "1")
+os.environ.setdefault("KIVY_NO_CONSOLELOG", "1")
+
+import main  # configures Kivy and loads the KV rules
+from benchmarks.legacy_form import LEGACY_FIELD_COUNT, LegacyDemographicsForm
+
+
+def build_schema(field_count: int) -> FormSchema:
+	kinds = (TEXT, TEXT, PHONE, CHOICE, MULTI)
+	fields: List[FieldSpec] = []
+	for idx in range(field_count):
+		kind = kinds[idx % len(kinds)]
+		options: Tuple[str, ...] = ()
+		if kind in (CHOICE, MULTI):
+			options = tuple(f"Option {n}" for n in range(5))
+		fields.append(
+			FieldSpec(
+				name=f"field_{idx}",
+				label=f"Field {idx}",
+				kind=kind,
+				hint=f"Value {idx}",
+				pattern=r"[A-Za-z][A-Za-z\s'\-]*" if kind == TEXT else None,
+				allowed_chars=r"A-Za-z\s'\-" if kind == TEXT else None,
+				options=options,
+			)
+		)
+	return FormSchema(title=f"{field_count}-field intake", fields=tuple(fields))
+
+
+def time_builds(factory: Callable[[], object], rounds: int, repeats: int, pause_gc: bool = False) -> float:
+	"""Best-of-``repeats`` mean build time over ``rounds`` builds."""
+	factory()  # warm up the widget classes and the compiled-schema cache
+	best = float("inf")
+	for _ in range(repeats):
+		gc.collect()
+		if pause_gc:
+			gc.disable()
+		try:
+			start = time.perf_counter()
+			for _ in range(rounds):
+				factory()
+			elapsed = time.perf_counter() - start
+		finally:
+			gc.enable()
+		best = min(best, elapsed / rounds)
+	return best
+
+
+def main_cli(argv: List[str]) -> int:
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+	parser.add_argument("--rounds", type=int, default=20)
+	parser.add_argument("--repeats", type=int, default=5)
+	parser.add_argument("--fields", type=int, default=40)
+	parser.add_argument("--tolerance", type=float, default=0.10, help="allowed per-field slowdown ratio")
+	parser.add_argument("--pause-gc", action="store_true", help="disable the cyclic GC during timed builds")
+	args = parser.parse_args(argv)
+
+	large_schema = build_schema(args.fields)
+	demo_fields = len(main.DEMOGRAPHICS_SCHEMA.fields)
+
+	compile_schema.cache_clear()
+	start = time.perf_counter()
+	compile_schema(large_schema)
+	cold_compile = time.perf_counter() - start
+	start = time.perf_counter()
+	compile_schema(large_schema)
+	warm_compile = time.perf_counter() - start
+
+	timing = dict(rounds=args.rounds, repeats=args.repeats, pause_gc=args.pause_gc)
+	legacy_time = time_builds(LegacyDemographicsForm, **timing)
+	demo_time = time_builds(main.DemographicsForm, **timing)
+	large_time = time_builds(lambda: main.SchemaForm(schema=large_schema), **timing)
+	legacy_per_field = legacy_time / LEGACY_FIELD_COUNT
+	large_per_field = large_time / args.fields
+
+	print(f"cyclic GC {'paused' if args.pause_gc else 'enabled'} during builds")
+	print(f"compile {args.fields}-field schema: cold {cold_compile * 1e3:.3f} ms, cached {warm_compile * 1e6:.1f} us")
+	for name, total, count in (
+		("hand-written form", legacy_time, LEGACY_FIELD_COUNT),
+		("demographics schema form", demo_time, demo_fields),
+		(f"{args.fields}-field schema form", large_time, args.fields),
+	):
+		print(f"{name:<26} ({count:>2} fields): {total * 1e3:7.2f} ms/build, {total / count * 1e3:6.3f} ms/field")
+
+	ratio = large_per_field / legacy_per_field
+	print(f"per-field ratio ({args.fields}-field schema / hand-written): {ratio:.2f}")
+	if ratio > 1 + args.tolerance:
+		print("FAIL: the schema form is slower per field than the hand-written form")
+		return 1
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main_cli(sys.argv[1:]))
@@ -0,0 +1,101 @@
+"""Measure EntryHistory storage growth and reconstruction cost over many edits.
+
+Run from the repository root::
+
+    python -m benchmarks.history_edits [--edits 1000000]
+
+Edits are spread over ``--entries`` entries. The run is repeated for edits that
+change one field and edits that change three fields; storage per edit should
+grow roughly in proportion to the number of changed fields rather than the
+size of the entry. Exits non-zero if the three-field run costs more than
+``--max-ratio`` times the one-field run per edit.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+from typing import Dict, List
+
+from entry_history import EntryHistory
+
+FIELDS = ("first_name", "last_name", "age_range", "genders_selected", "phone_number")
+AGE_RANGES = ("18-24", "25-34", "35-44", "45-54", "55+")
+
+
+def base_entry(idx: int) -> Dict[str, object]:
+	return {
+		"first_name": f"First{idx}",
+		"last_name": f"Last{idx}",
+		"age_range": AGE_RANGES[idx % len(AGE_RANGES)],
+		"genders_selected": ["Prefer not to say"],
+		"phone_number": f"(555) 555-{idx % 10000:04d}",
+	}
+
+
+def run(edits: int, entries: int, changed_fields: int, seed: int) -> Dict[str, float]:
+	rng = random.Random(seed)
+	current = [base_entry(idx) for idx in range(entries)]
+	# Pre-generate edit values so the measurement only covers history storage.
+	values = [f"Value{n}" for n in range(1024)]
+	history = EntryHistory()
+	for idx, entry in enumerate(current):
+		history.record(idx, entry, timestamp=0.0)
+
+	tracemalloc.start()
+	before, _peak = tracemalloc.get_traced_memory()
+	start = time.perf_counter()
+	for n in range(edits):
+		idx = n % entries
+		entry = dict(current[idx])
+		for field in rng.sample(FIELDS, changed_fields):
+			entry[field] = values[n % len(values)] if field != "genders_selected" else [values[n % len(values)]]
+		current[idx] = entry
+		history.record(idx, entry, timestamp=float(n))
+	elapsed = time.perf_counter() - start
+	after, _peak = tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+
+	samples = min(10000, edits)
+	reconstruct_start = time.perf_counter()
+	for n in range(samples):
+		idx = n % entries
+		history.get(idx, rng.randrange(history.version_count(idx)))
+	reconstruct = (time.perf_counter() - reconstruct_start) / samples
+
+	return {
+		"bytes_per_edit": (after - before) / edits,
+		"us_per_edit": elapsed / edits * 1e6,
+		"us_per_reconstruct": reconstruct * 1e6,
+	}
+
+
+def main_cli(argv: List[str]) -> int:
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+	parser.add_argument("--edits", type=int, default=1_000_000)
+	parser.add_argument("--entries", type=int, default=1000)
+	parser.add_argument("--seed", type=int, default=0)
+	parser.add_argument("--max-ratio", type=float, default=3.5)
+	args = parser.parse_args(argv)
+
+	results = {}
+	for changed in (1, 3):
+		results[changed] = result = run(args.edits, args.entries, changed, args.seed)
+		print(
+			f"{args.edits} edits changing {changed} field(s): {result['bytes_per_edit']:.1f} B/edit, "
+			f"{result['us_per_edit']:.2f} us/edit, {result['us_per_reconstruct']:.2f} us/reconstruct"
+		)
+
+	ratio = results[3]["bytes_per_edit"] / results[1]["bytes_per_edit"]
+	print(f"storage ratio (3 fields / 1 field): {ratio:.2f}")
+	if ratio > args.max_ratio:
+		print("FAIL: storage per edit grows faster than the number of changed fields")
+		return 1
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main_cli(sys.argv[1:]))
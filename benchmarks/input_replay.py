@@ -0,0 +1,424 @@
+"""Replay synthetic input streams against DemographicsApp and find the sustainable input rate.
+
+Streams are JSON lines; every event has a time offset ``t`` in seconds and a
+``type``:
+
+* ``new`` opens a blank form (``start_new_entry``)
+* ``focus`` sets ``focus`` of text field ``field`` to ``value``
+* ``key`` types ``value`` into text field ``field`` through its input filter
+* ``backspace`` deletes one character from text field ``field``
+* ``check`` sets option ``option`` of checkbox group ``field`` to ``value``
+* ``select`` picks ``value`` in spinner ``field``
+* ``submit`` presses Submit
+
+Text fields and spinners are addressed by widget id (``first_name``,
+``last_name``, ``phone_input``, ``age_spinner``); checkbox groups by payload
+field (``genders_selected``). Run from the repository root::
+
+    python -m benchmarks.input_replay --generate 20
+    python -m benchmarks.input_replay --generate 20 --rate 100 --rate 1000
+    python -m benchmarks.input_replay --events recorded.jsonl --save-report replay.json
+
+Each rate replays ``--rate-duration`` seconds of input (repeating the stream
+as needed) with events spread to arrive at that many events per second. Like
+real Kivy input, due events are handled once per Clock frame, up to
+``--frame-budget`` seconds of handler time per frame; events still due after
+that are the backlog. A rate is sustained while the backlog carried over past
+a frame stays within ``--max-backlog`` at the 95th percentile and events are
+dispatched within ``--max-lag`` (one 60 Hz frame by default) of coming due at
+the 95th percentile, so slow frames count even when every due event fits the
+budget once the frame finally runs. Without
+``--rate`` the rate is doubled until it is no longer sustained and then
+bisected, so the reported maximum is a measured limit.
+Without a display, wrap the command in ``xvfb-run``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import random
+import statistics
+import sys
+import time
+from bisect import bisect_right
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from form_schema import DEMOGRAPHICS_SCHEMA
+
+Event = Dict[str, object]
+
+FIRST_NAMES = ("Ana", "Bo", "Chidi", "Dana", "Eli", "Farah", "Gus", "Hana", "Ivan", "June")
+LAST_NAMES = ("Okafor", "Smith", "Nguyen", "O'Brien", "Garcia", "Kowalski", "Lee", "Haddad")
+
+
+def generate_stream(sessions: int, seed: int = 0) -> List[Event]:
+	"""Build a stream of complete form sessions spaced one event per second."""
+	rng = random.Random(seed)
+	age_field = DEMOGRAPHICS_SCHEMA.field("age_range")
+	gender_field = DEMOGRAPHICS_SCHEMA.field("genders_selected")
+	events: List[Event] = []
+
+	def add(event_type: str, **fields: object) -> None:
+		events.append({"t": float(len(events)), "type": event_type, **fields})
+
+	def type_text(field: str, text: str) -> None:
+		add("focus", field=field, value=True)
+		for char in text:
+			add("key", field=field, value=char)
+		if rng.random() < 0.2:
+			add("backspace", field=field)
+			add("key", field=field, value=text[-1])
+		add("focus", field=field, value=False)
+
+	for _ in range(sessions):
+		add("new")
+		type_text("first_name", rng.choice(FIRST_NAMES))
+		type_text("last_name", rng.choice(LAST_NAMES))
+		add("select", field="age_spinner", value=rng.choice(age_field.options))
+		for option in rng.sample(gender_field.options, rng.randint(1, 2)):
+			add("check", field=gender_field.name, option=option, value=True)
+		type_text("phone_input", "".join(rng.choice("0123456789") for _ in range(10)))
+		add("submit")
+	return events
+
+
+def load_stream(path: str) -> List[Event]:
+	with open(path) as handle:
+		return [json.loads(line) for line in handle if line.strip()]
+
+
+def save_stream(path: str, events: List[Event]) -> None:
+	with open(path, "w") as handle:
+		for event in events:
+			handle.write(json.dumps(event) + "\n")
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+	if not samples:
+		return 0.0
+	ordered = sorted(samples)
+	return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def dispatch_event(app, event: Event) -> None:
+	"""Apply one input event to a running DemographicsApp."""
+	form = app.form_screen.form
+	event_type = event["type"]
+	if event_type == "new":
+		app.start_new_entry()
+	elif event_type == "focus":
+		form.ids[event["field"]].focus = bool(event["value"])
+	elif event_type == "key":
+		form.ids[event["field"]].insert_text(str(event["value"]))
+	elif event_type == "backspace":
+		form.ids[event["field"]].do_backspace()
+	elif event_type == "check":
+		form.option_checkboxes[event["field"]][event["option"]].active = bool(event["value"])
+	elif event_type == "select":
+		form.ids[event["field"]].text = str(event["value"])
+	elif event_type == "submit":
+		form.submit_form()
+	else:
+		raise ValueError(f"Unknown event type {event_type!r}")
+
+
+class RateSearch:
+	"""Chooses the next replay rate from the previous result.
+
+	With explicit ``rates`` it simply walks the list. Otherwise it multiplies the
+	rate by ``factor`` until a rate is not sustained (or ``max_rate`` is reached)
+	and then bisects between the best sustained and the first failing rate for
+	``bisect_steps`` more runs.
+	"""
+
+	def __init__(
+		self,
+		rates: Optional[List[float]] = None,
+		start: float = 50,
+		factor: float = 2,
+		bisect_steps: int = 4,
+		max_rate: float = 100_000,
+	):
+		self._fixed = list(rates) if rates else None
+		self.start = start
+		self.factor = factor
+		self.bisect_steps = bisect_steps
+		self.max_rate = max_rate
+		self.best: Optional[float] = None
+		self._failed: Optional[float] = None
+
+	def next_rate(self, last: Optional[Dict[str, object]]) -> Optional[float]:
+		if self._fixed is not None:
+			return self._fixed.pop(0) if self._fixed else None
+		if last is None:
+			return self.start
+		rate = float(last["rate"])
+		if last["sustained"]:
+			self.best = max(self.best or 0.0, rate)
+		else:
+			self._failed = rate if self._failed is None else min(self._failed, rate)
+		if self._failed is None:
+			if rate >= self.max_rate:
+				return None
+			return min(rate * self.factor, self.max_rate)
+		if self.bisect_steps <= 0:
+			return None
+		self.bisect_steps -= 1
+		return ((self.best or 0.0) + self._failed) / 2
+
+
+class Replayer:
+	"""Feeds events to the app from a Clock interval, as Kivy delivers real input.
+
+	Each frame dispatches the events that have come due, but stops once it has
+	spent ``frame_budget`` seconds on handlers, so a frame's input work never
+	exceeds one frame. Events that are due but not dispatched form the backlog.
+	A rate is sustained while the backlog left at the end of a frame stays
+	within ``max_backlog`` at the 95th percentile, the 95th percentile lag from
+	an event coming due to its dispatch stays within ``max_lag``, and the stream
+	drains without running past ``overrun`` times its scheduled duration.
+	"""
+
+	def __init__(
+		self,
+		app,
+		events: List[Event],
+		search: RateSearch,
+		frame_budget: float,
+		rate_duration: float,
+		on_done,
+		max_backlog: int = 0,
+		max_lag: float = 1 / 60,
+		overrun: float = 2.0,
+	):
+		self.app = app
+		self.events = events
+		self.search = search
+		self.frame_budget = frame_budget
+		self.rate_duration = rate_duration
+		self.on_done = on_done
+		self.max_backlog = max_backlog
+		self.max_lag = max_lag
+		self.overrun = overrun
+		self.results: List[Dict[str, object]] = []
+		origin = float(events[0]["t"])
+		self._offsets = [float(event["t"]) - origin for event in events]
+		gap = self._offsets[-1] / (len(events) - 1) if len(events) > 1 and self._offsets[-1] > 0 else 1.0
+		# One pass through the stream, including the gap before it repeats.
+		self._span = self._offsets[-1] + gap
+		self._event = None
+
+	def start(self) -> None:
+		from kivy.clock import Clock
+
+		rate = self.search.next_rate(None)
+		if rate is None:
+			self.on_done(self.results)
+			return
+		self._begin_rate(rate)
+		self._event = Clock.schedule_interval(self._tick, 0)
+
+	def _begin_rate(self, rate: float) -> None:
+		count = max(len(self.events), math.ceil(rate * self.rate_duration))
+		scale = len(self.events) / (self._span * rate)
+		size = len(self.events)
+		self._rate = rate
+		self._due = [
+			((index // size) * self._span + self._offsets[index % size]) * scale for index in range(count)
+		]
+		self._cursor = 0
+		self._frames = 0
+		self._latency: Dict[str, List[float]] = defaultdict(list)
+		self._lag: List[float] = []
+		self._backlog: List[int] = []
+		self._carried: List[int] = []
+		self._frame_work: List[float] = []
+		self._frame_gaps: List[float] = []
+		self._last_frame: Optional[float] = None
+		self.app.start_new_entry()
+		self._start = time.perf_counter()
+
+	def _tick(self, _dt):
+		self._frames += 1
+		frame_start = time.perf_counter()
+		if self._last_frame is not None:
+			self._frame_gaps.append(frame_start - self._last_frame)
+		self._last_frame = frame_start
+		due, count = self._due, len(self._due)
+		now = frame_start - self._start
+		due_at_start = bisect_right(due, now)
+		self._backlog.append(due_at_start - self._cursor)
+		while self._cursor < count and due[self._cursor] <= now:
+			if time.perf_counter() - frame_start >= self.frame_budget:
+				break
+			event = self.events[self._cursor % len(self.events)]
+			dispatched = time.perf_counter()
+			dispatch_event(self.app, event)
+			finished = time.perf_counter()
+			self._lag.append(dispatched - self._start - due[self._cursor])
+			self._latency[str(event["type"])].append(finished - dispatched)
+			self._cursor += 1
+			now = finished - self._start
+		self._frame_work.append(time.perf_counter() - frame_start)
+		# Events that were already due when the frame began but did not fit its budget.
+		self._carried.append(max(0, due_at_start - self._cursor))
+		overran = now > due[-1] * self.overrun + self.frame_budget * 4
+		if self._cursor < count and not overran:
+			return True
+		result = self._finish_rate(now, drained=self._cursor >= count)
+		rate = self.search.next_rate(result)
+		if rate is not None:
+			self._begin_rate(rate)
+			return True
+		self.on_done(self.results)
+		return False
+
+	def _finish_rate(self, elapsed: float, drained: bool) -> Dict[str, object]:
+		carried_p95 = percentile(self._carried, 0.95)
+		lag_p95 = percentile(self._lag, 0.95)
+		failures = []
+		if not drained:
+			failures.append(f"stopped after {self._cursor} of {len(self._due)} events")
+		if carried_p95 > self.max_backlog:
+			failures.append(f"carried backlog p95 {carried_p95} > {self.max_backlog}")
+		if lag_p95 > self.max_lag:
+			failures.append(f"lag p95 {lag_p95 * 1e3:.2f} ms > {self.max_lag * 1e3:.2f} ms")
+		result = {
+			"rate": self._rate,
+			"events": self._cursor,
+			"scheduled_events": len(self._due),
+			"drained": drained,
+			"elapsed_s": elapsed,
+			"frames": self._frames,
+			"backlog_p50": percentile(self._backlog, 0.5),
+			"backlog_p95": percentile(self._backlog, 0.95),
+			"backlog_max": max(self._backlog),
+			"carried_p95": carried_p95,
+			"carried_max": max(self._carried),
+			"frame_work_p95_ms": percentile(self._frame_work, 0.95) * 1e3,
+			"frame_interval_p95_ms": percentile(self._frame_gaps, 0.95) * 1e3,
+			"lag_p50_ms": percentile(self._lag, 0.5) * 1e3,
+			"lag_p95_ms": lag_p95 * 1e3,
+			"lag_max_ms": max(self._lag, default=0.0) * 1e3,
+			"sustained": not failures,
+			"failures": failures,
+			"latency_ms": {
+				event_type: {
+					"count": len(samples),
+					"mean": statistics.fmean(samples) * 1e3,
+					"p95": percentile(samples, 0.95) * 1e3,
+					"max": max(samples) * 1e3,
+				}
+				for event_type, samples in sorted(self._latency.items())
+			},
+		}
+		self.results.append(result)
+		return result
+
+
+def run_replay(
+	events: List[Event],
+	search: RateSearch,
+	frame_budget: float,
+	rate_duration: float,
+	max_backlog: int,
+	max_lag: float,
+) -> List[Dict[str, object]]:
+	os.environ.setdefault("KIVY_NO_ARGS", "1")
+	os.environ.setdefault("KIVY_NO_CONSOLELOG", "1")
+
+	import main  # configures Kivy and loads the KV rules
+
+	results: List[Dict[str, object]] = []
+
+	class ReplayApp(main.DemographicsApp):
+		def on_start(self):
+			super().on_start()
+			# Clock holds interval callbacks weakly, so the app must keep the replayer alive.
+			self.replayer = Replayer(
+				self,
+				events,
+				search,
+				frame_budget,
+				rate_duration,
+				self._on_done,
+				max_backlog=max_backlog,
+				max_lag=max_lag,
+			)
+			self.replayer.start()
+
+		def _on_done(self, replay_results):
+			results.extend(replay_results)
+			self.stop()
+
+	ReplayApp().run()
+	return results
+
+
+def format_report(results: List[Dict[str, object]], frame_budget: float) -> str:
+	lines = [f"input budget per frame {frame_budget * 1e3:.1f} ms"]
+	for result in sorted(results, key=lambda item: item["rate"]):
+		status = "ok" if result["sustained"] else "LAGGING: " + "; ".join(result["failures"])
+		lines.append(
+			f"{result['rate']:>9.0f} ev/s  backlog p50 {result['backlog_p50']:>5} p95 {result['backlog_p95']:>5} "
+			f"max {result['backlog_max']:>6}  carried p95 {result['carried_p95']:>5}  "
+			f"frame interval p95 {result['frame_interval_p95_ms']:7.2f} ms  lag p95 {result['lag_p95_ms']:8.2f} ms  {status}"
+		)
+		for event_type, stats in result["latency_ms"].items():
+			lines.append(
+				f"    {event_type:<10} n={stats['count']:<6} mean {stats['mean']:.3f} ms  "
+				f"p95 {stats['p95']:.3f} ms  max {stats['max']:.3f} ms"
+			)
+	sustained = [result["rate"] for result in results if result["sustained"]]
+	best: Optional[float] = max(sustained) if sustained else None
+	lines.append(f"max sustainable rate: {best:.0f} ev/s" if best is not None else "max sustainable rate: none")
+	failed = [result["rate"] for result in results if not result["sustained"]]
+	if best is not None and not any(rate > best for rate in failed):
+		lines.append("(no tested rate failed; raise --max-rate to find the limit)")
+	return "\n".join(lines)
+
+
+def main_cli(argv: List[str]) -> int:
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+	source = parser.add_mutually_exclusive_group()
+	source.add_argument("--events", help="JSON lines file with a recorded stream")
+	source.add_argument("--generate", type=int, default=10, help="number of generated form sessions")
+	parser.add_argument("--seed", type=int, default=0)
+	parser.add_argument("--rate", type=float, action="append", help="test exactly these rates (events/s), repeatable")
+	parser.add_argument("--start-rate", type=float, default=50, help="first rate of the automatic search")
+	parser.add_argument("--max-rate", type=float, default=100_000)
+	parser.add_argument("--bisect-steps", type=int, default=4)
+	parser.add_argument("--rate-duration", type=float, default=3.0, help="seconds of input replayed per rate")
+	parser.add_argument("--frame-budget", type=float, default=1 / 60, help="handler time allowed per frame")
+	parser.add_argument("--max-backlog", type=int, default=0, help="allowed p95 events left over after a frame")
+	parser.add_argument("--max-lag", type=float, default=1 / 60, help="allowed p95 seconds from due to dispatch")
+	parser.add_argument("--save-stream", help="write the replayed stream as JSON lines")
+	parser.add_argument("--save-report", help="write the results as JSON")
+	args = parser.parse_args(argv)
+
+	events = load_stream(args.events) if args.events else generate_stream(args.generate, args.seed)
+	if not events:
+		parser.error("event stream is empty")
+	if args.save_stream:
+		save_stream(args.save_stream, events)
+
+	search = RateSearch(
+		sorted(args.rate) if args.rate else None,
+		start=args.start_rate,
+		bisect_steps=args.bisect_steps,
+		max_rate=args.max_rate,
+	)
+	results = run_replay(events, search, args.frame_budget, args.rate_duration, args.max_backlog, args.max_lag)
+	print(format_report(results, args.frame_budget))
+	if args.save_report:
+		with open(args.save_report, "w") as handle:
+			json.dump(results, handle, indent=2)
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main_cli(sys.argv[1:]))
@@ -0,0 +1,204 @@
+"""Measure layout and first-frame time across simulated densities and window sizes.
+
+Every matrix cell runs the app in a separate process, because config_kivy() can
+only apply one simulated device per launch. Run from the repository root::
+
+    python -m benchmarks.layout_matrix --density 1.0:96 --density 2.0:192 --size 400x500 --size 800x1280
+
+Without a display, wrap the command in ``xvfb-run``. The report compares each
+cell against the first one and flags cells slower than ``--threshold`` times it.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+RESULT_MARKER = "LAYOUT_RESULT "
+DEFAULT_DENSITIES = ("1.0:96", "2.0:192", "3.0:288")
+DEFAULT_SIZES = ("400x500", "800x1280", "1080x1920")
+CHILD_ATTEMPTS = 3  # config_kivy() exits once after storing or updating the device density
+
+
+def parse_density(value: str) -> Tuple[float, int]:
+	density, _, dpi = value.partition(":")
+	return float(density), int(dpi or float(density) * 96)
+
+
+def parse_size(value: str) -> Tuple[int, int]:
+	width, _, height = value.lower().partition("x")
+	return int(width), int(height)
+
+
+# --- child process -------------------------------------------------------------
+
+
+def _relayout(root) -> None:
+	"""Lay out the tree synchronously, parents before children.
+
+	RecycleLayouts cannot be laid out directly (their do_layout() asserts), so
+	each RecycleView is refreshed through its own layout path instead.
+	"""
+	from kivy.uix.layout import Layout
+	from kivy.uix.recyclelayout import RecycleLayout
+	from kivy.uix.recycleview import RecycleViewBehavior
+
+	for widget in root.walk(restrict=True):
+		if isinstance(widget, RecycleViewBehavior):
+			widget.refresh_from_layout()
+			widget.refresh_views()
+		elif isinstance(widget, Layout) and not isinstance(widget, RecycleLayout):
+			widget.do_layout()
+
+
+def _time_layout(root, rounds: int) -> float:
+	samples = []
+	width, height = root.size
+	for idx in range(rounds):
+		root.size = (width + (idx % 2), height)
+		start = time.perf_counter()
+		_relayout(root)
+		samples.append(time.perf_counter() - start)
+	root.size = (width, height)
+	return statistics.median(samples)
+
+
+def run_child(rounds: int, rows: int) -> None:
+	process_start = time.perf_counter()
+
+	import main  # configures Kivy from the KIVY_HELPER_* environment
+
+	from kivy.core.window import Window
+	from kivy.metrics import Metrics
+
+	class BenchApp(main.DemographicsApp):
+		def on_start(self):
+			super().on_start()
+			self.first_frame = None
+			Window.bind(on_flip=self._on_first_flip)
+
+		def _on_first_flip(self, *_):
+			Window.unbind(on_flip=self._on_first_flip)
+			self.first_frame = time.perf_counter() - process_start
+			self.measure()
+
+		def measure(self):
+			for idx in range(rows):
+				self.entries.add({"first_name": f"First{idx}", "last_name": f"Last{idx}"})
+			self.refresh_list_view()
+			form_screen = self.form_screen
+			form_screen.size = Window.size
+			form_screen.load_entry(None)
+			result = {
+				"density": Metrics.density,
+				"dpi": Metrics.dpi,
+				"window": list(Window.size),
+				"first_frame_s": self.first_frame,
+				"list_layout_s": _time_layout(self.list_screen, rounds),
+				"form_layout_s": _time_layout(form_screen.form, rounds),
+			}
+			print(RESULT_MARKER + json.dumps(result), flush=True)
+			self.stop()
+
+	BenchApp().run()
+
+
+# --- parent process ------------------------------------------------------------
+
+
+def run_cell(density: float, dpi: int, size: Tuple[int, int], rounds: int, rows: int) -> Optional[Dict[str, object]]:
+	env = dict(os.environ)
+	env.update(
+		{
+			"KIVY_NO_ARGS": "1",
+			"KIVY_NO_CONSOLELOG": "1",
+			"KIVY_HELPER_WINDOW_WIDTH": str(size[0]),
+			"KIVY_HELPER_WINDOW_HEIGHT": str(size[1]),
+			"KIVY_HELPER_SIMULATE_DENSITY": str(density),
+			"KIVY_HELPER_SIMULATE_DPI": str(dpi),
+		}
+	)
+	command = [sys.executable, "-m", "benchmarks.layout_matrix", "--child", "--rounds", str(rounds), "--rows", str(rows)]
+	for _ in range(CHILD_ATTEMPTS):
+		completed = subprocess.run(command, env=env, capture_output=True, text=True)
+		for line in completed.stdout.splitlines():
+			if line.startswith(RESULT_MARKER):
+				return json.loads(line[len(RESULT_MARKER):])
+		if completed.returncode != 0:
+			sys.stderr.write(completed.stderr)
+			return None
+	return None
+
+
+def format_report(cells: List[Dict[str, object]], threshold: float) -> str:
+	lines = [
+		"# Layout benchmark matrix",
+		"",
+		"| density | dpi | window | first frame (ms) | list layout (ms) | form layout (ms) | vs. baseline |",
+		"|---|---|---|---|---|---|---|",
+	]
+	baseline = next((cell for cell in cells if cell.get("result")), None)
+	for cell in cells:
+		result = cell.get("result")
+		label = f"| {cell['density']} | {cell['dpi']} | {cell['size'][0]}x{cell['size'][1]} |"
+		if not result:
+			lines.append(f"{label} failed | | | |")
+			continue
+		ratios = []
+		if baseline is not None:
+			base = baseline["result"]
+			for key in ("first_frame_s", "list_layout_s", "form_layout_s"):
+				ratios.append(result[key] / base[key] if base[key] else 1.0)
+		flag = " **slow**" if any(ratio > threshold for ratio in ratios) else ""
+		ratio_text = " / ".join(f"{ratio:.2f}x" for ratio in ratios)
+		lines.append(
+			f"{label} {result['first_frame_s'] * 1e3:.1f} | {result['list_layout_s'] * 1e3:.2f} | "
+			f"{result['form_layout_s'] * 1e3:.2f} | {ratio_text}{flag} |"
+		)
+	lines.append("")
+	lines.append(f"Ratios are first frame / list layout / form layout relative to the first row; "
+		f"cells above {threshold:.1f}x are marked slow.")
+	return "\n".join(lines) + "\n"
+
+
+def main_cli(argv: List[str]) -> int:
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+	parser.add_argument("--density", action="append", help="density:dpi pair, repeatable")
+	parser.add_argument("--size", action="append", help="WIDTHxHEIGHT window size, repeatable")
+	parser.add_argument("--rounds", type=int, default=25)
+	parser.add_argument("--rows", type=int, default=200, help="entries shown in the list screen")
+	parser.add_argument("--threshold", type=float, default=2.0)
+	parser.add_argument("--output", default="layout_matrix_report.md")
+	parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+	args = parser.parse_args(argv)
+
+	if args.child:
+		run_child(args.rounds, args.rows)
+		return 0
+
+	cells: List[Dict[str, object]] = []
+	for density_arg in args.density or DEFAULT_DENSITIES:
+		density, dpi = parse_density(density_arg)
+		for size_arg in args.size or DEFAULT_SIZES:
+			size = parse_size(size_arg)
+			print(f"density {density} dpi {dpi} window {size[0]}x{size[1]} ...", flush=True)
+			result = run_cell(density, dpi, size, args.rounds, args.rows)
+			cells.append({"density": density, "dpi": dpi, "size": size, "result": result})
+
+	report = format_report(cells, args.threshold)
+	with open(args.output, "w") as handle:
+		handle.write(report)
+	with open(os.path.splitext(args.output)[0] + ".json", "w") as handle:
+		json.dump(cells, handle, indent=2)
+	print(report)
+	return 0 if all(cell["result"] for cell in cells) else 1
+
+
+if __name__ == "__main__":
+	sys.exit(main_cli(sys.argv[1:]))
@@ -0,0 +1,303 @@
+"""The hand-written demographics form from before schema-driven forms, kept as a benchmark reference.
+
+``benchmarks.form_build`` compares its per-field build cost against forms
+generated by ``SchemaForm``. Import ``main`` before this module so Kivy is
+configured and the shared KV rules (``StylizedLabel``, ``FormTextInput``,
+``FormSpinnerOption``) are loaded.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Dict
+
+from kivy.lang import Builder
+from kivy.properties import BooleanProperty, ListProperty, StringProperty
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.checkbox import CheckBox
+
+LEGACY_FIELD_COUNT = 5
+
+KV = """
+#:import dp kivy.metrics.dp
+#:import sp kivy.metrics.sp
+
+<LegacyDemographicsForm>:
+	orientation: 'vertical'
+	padding: dp(18)
+	spacing: dp(14)
+	canvas.before:
+		Color:
+			rgba: 1, 1, 1, 1
+		RoundedRectangle:
+			pos: self.pos
+			size: self.size
+			radius: [dp(12)]
+	ScrollView:
+		do_scroll_x: False
+		do_scroll_y: True
+		bar_width: dp(6)
+		GridLayout:
+			id: form_container
+			cols: 1
+			size_hint_y: None
+			height: self.minimum_height
+			padding: 0, 0, 0, dp(20)
+			spacing: dp(12)
+			Label:
+				text: "Demographics Entry"
+				size_hint_y: None
+				height: self.texture_size[1] + dp(12)
+				font_size: sp(22)
+				bold: True
+				color: 0.05, 0.2, 0.35, 1
+			Label:
+				text: "Provide your information below. Fields marked with * are required."
+				text_size: self.width, None
+				size_hint_y: None
+				height: self.texture_size[1]
+				color: 0.25, 0.25, 0.3, 1
+				font_size: sp(14)
+			StylizedLabel:
+				text: "Name*"
+			BoxLayout:
+				size_hint_y: None
+				height: dp(44)
+				spacing: dp(10)
+				FormTextInput:
+					id: first_name
+					hint_text: "First name"
+				FormTextInput:
+					id: last_name
+					hint_text: "Last name"
+			StylizedLabel:
+				text: "Age range*"
+			Spinner:
+				id: age_spinner
+				size_hint_y: None
+				height: dp(44)
+				font_size: sp(16)
+				text: root.age_prompt
+				values: root.age_options
+				background_normal: ''
+				background_color: 0.96, 0.97, 0.99, 1
+				color: 0.12, 0.12, 0.2, 1
+				option_cls: 'FormSpinnerOption'
+			StylizedLabel:
+				text: "Gender (check all that apply)*"
+			BoxLayout:
+				orientation: 'vertical'
+				size_hint_y: None
+				height: self.minimum_height
+				padding: dp(12)
+				spacing: dp(8)
+				canvas.before:
+					Color:
+						rgba: 0.92, 0.95, 0.99, 1
+					RoundedRectangle:
+						pos: self.pos
+						size: self.size
+						radius: [dp(8)]
+				Label:
+					text: "Based on SOGI practice guidance, please select all that apply."
+					size_hint_y: None
+					text_size: self.width - dp(24), None
+					halign: 'left'
+					valign: 'middle'
+					height: self.texture_size[1] + dp(6)
+					color: 0.2, 0.25, 0.35, 1
+					font_size: sp(13)
+				GridLayout:
+					cols: 2
+					size_hint_y: None
+					height: self.minimum_height
+					row_default_height: dp(32)
+					row_force_default: True
+					spacing: dp(6)
+					BoxLayout:
+						size_hint_y: None
+						height: dp(32)
+						spacing: dp(6)
+						CheckBox:
+							id: gender_woman
+							size_hint: None, None
+							size: dp(24), dp(24)
+							on_active: root.on_gender_toggle('Woman/girl', self.active)
+						Label:
+							text: "Woman / girl"
+							font_size: sp(14)
+							color: 0.12, 0.12, 0.18, 1
+							halign: 'left'
+							valign: 'middle'
+							text_size: self.size
+					BoxLayout:
+						size_hint_y: None
+						height: dp(32)
+						spacing: dp(6)
+						CheckBox:
+							id: gender_man
+							size_hint: None, None
+							size: dp(24), dp(24)
+							on_active: root.on_gender_toggle('Man/boy', self.active)
+						Label:
+							text: "Man / boy"
+							font_size: sp(14)
+							color: 0.12, 0.12, 0.18, 1
+							halign: 'left'
+							valign: 'middle'
+							text_size: self.size
+					BoxLayout:
+						size_hint_y: None
+						height: dp(32)
+						spacing: dp(6)
+						CheckBox:
+							id: gender_nb
+							size_hint: None, None
+							size: dp(24), dp(24)
+							on_active: root.on_gender_toggle('Non-binary', self.active)
+						Label:
+							text: "Non-binary"
+							font_size: sp(14)
+							color: 0.12, 0.12, 0.18, 1
+							halign: 'left'
+							valign: 'middle'
+							text_size: self.size
+					BoxLayout:
+						size_hint_y: None
+						height: dp(32)
+						spacing: dp(6)
+						CheckBox:
+							id: gender_two_spirit
+							size_hint: None, None
+							size: dp(24), dp(24)
+							on_active: root.on_gender_toggle('Two-Spirit', self.active)
+						Label:
+							text: "Two-Spirit"
+							font_size: sp(14)
+							color: 0.12, 0.12, 0.18, 1
+							halign: 'left'
+							valign: 'middle'
+							text_size: self.size
+					BoxLayout:
+						size_hint_y: None
+						height: dp(32)
+						spacing: dp(6)
+						CheckBox:
+							id: gender_prefer_no
+							size_hint: None, None
+							size: dp(24), dp(24)
+							on_active: root.on_gender_toggle('Prefer not to say', self.active)
+						Label:
+							text: "Prefer not to say"
+							font_size: sp(14)
+							color: 0.12, 0.12, 0.18, 1
+							halign: 'left'
+							valign: 'middle'
+							text_size: self.size
+			StylizedLabel:
+				text: "Phone number*"
+			FormTextInput:
+				id: phone_input
+				hint_text: "(555) 555-5555"
+
+	BoxLayout:
+		size_hint_y: None
+		height: dp(56)
+		spacing: dp(12)
+		padding: 0, dp(4)
+		Button:
+			text: "Cancel"
+			font_size: sp(16)
+			background_normal: ''
+			background_color: 0.75, 0.2, 0.2, 1
+			color: 1, 1, 1, 1
+			on_release: root.cancel_form()
+		Button:
+			id: submit_btn
+			text: "Submit"
+			font_size: sp(16)
+			background_normal: ''
+			background_color: (0.16, 0.55, 0.4, 1) if not self.disabled else (0.7, 0.7, 0.7, 1)
+			color: 1, 1, 1, 1
+			disabled: root.submit_disabled
+			on_release: root.submit_form()
+"""
+
+
+class LegacyDemographicsForm(BoxLayout):
+	"""Original KV form; only the parts needed to build and bind it are kept."""
+
+	age_options = ListProperty(["18-24", "25-34", "35-44", "45-54", "55+"])
+	age_prompt = StringProperty("Select age range")
+	submit_disabled = BooleanProperty(True)
+
+	_invalid_name_chars = re.compile(r"[^A-Za-z\s'\-]")
+	_invalid_phone_chars = re.compile(r"[^0-9()\-\s]")
+	_digits_only = re.compile(r"\D")
+	_name_pattern = re.compile(r"^[A-Za-z][A-Za-z\s'\-]*$")
+
+	def __init__(self, **kwargs):
+		self.selected_genders: set[str] = set()
+		self.gender_checkboxes: Dict[str, CheckBox] = {}
+		super().__init__(**kwargs)
+
+	def on_kv_post(self, base_widget):
+		super().on_kv_post(base_widget)
+		# The original deferred this to the next frame with Clock.schedule_once;
+		# it runs inline here so a build includes the binding work.
+		self._bind_inputs()
+
+	def _bind_inputs(self, *_):
+		for field in (self.ids.first_name, self.ids.last_name):
+			field.bind(text=self._on_input)
+			field.input_filter = self._name_input_filter
+		phone_input = self.ids.phone_input
+		phone_input.bind(text=self._on_input, focus=self._on_input)
+		phone_input.input_filter = self._phone_input_filter
+		self.ids.age_spinner.bind(text=self._on_input)
+		self.gender_checkboxes = {
+			"Woman/girl": self.ids.gender_woman,
+			"Man/boy": self.ids.gender_man,
+			"Non-binary": self.ids.gender_nb,
+			"Two-Spirit": self.ids.gender_two_spirit,
+			"Prefer not to say": self.ids.gender_prefer_no,
+		}
+		self._update_submit_state()
+
+	def _name_input_filter(self, substring: str, from_undo: bool) -> str:  # noqa: ARG002
+		return self._invalid_name_chars.sub("", substring)
+
+	def _phone_input_filter(self, substring: str, from_undo: bool) -> str:  # noqa: ARG002
+		return self._invalid_phone_chars.sub("", substring)
+
+	def _on_input(self, *_):
+		self._update_submit_state()
+
+	def on_gender_toggle(self, label: str, active: bool) -> None:
+		if active:
+			self.selected_genders.add(label)
+		else:
+			self.selected_genders.discard(label)
+		self._update_submit_state()
+
+	def _update_submit_state(self) -> None:
+		digits = self._digits_only.sub("", self.ids.phone_input.text)
+		ready = all(
+			[
+				self._name_pattern.match(self.ids.first_name.text.strip()),
+				self._name_pattern.match(self.ids.last_name.text.strip()),
+				self.ids.age_spinner.text in self.age_options,
+				self.selected_genders,
+				len(digits) == 10,
+			]
+		)
+		self.submit_disabled = not ready
+
+	def submit_form(self) -> None:
+		pass
+
+	def cancel_form(self) -> None:
+		pass
+
+
+Builder.load_string(KV)
@@ -0,0 +1,293 @@
+"""Soak-test the new-entry/submit cycle and fail on memory or Clock growth.
+
+Each cycle opens a blank form, types a complete entry, submits it and returns
+to the list, driven by the same events as ``benchmarks.input_replay``. A cycle
+is spread over frames: after opening the form and after submitting, the runner
+waits for the screen transition to finish, as a real user would. Run from the
+repository root::
+
+    python -m benchmarks.soak --duration 14400 --report soak_report.json
+
+Every ``--sample-interval`` seconds the run records RSS, live object counts by
+type and the number of scheduled Clock events, and keeps a tracemalloc
+snapshot. Growth is measured from the first sample after ``--warmup-cycles``
+to the last one. RSS growth is split into Python allocations that tracemalloc
+tracks and native memory it cannot attribute (textures, GL/SDL buffers, C
+extension allocations), since only the former shows up in the allocation
+sites. Native caches keep filling for a while after warm-up and then level
+off, so the RSS limit applies to the growth rate over the second half of the
+run, projected over all measured cycles: a leak fails, a plateau does not.
+Submitted entries are deleted (and their history dropped) after each cycle
+unless ``--keep-entries`` is given, so the expected steady state is flat and
+any remaining growth points at leaked widgets, bindings or rows. Without a
+display, wrap the command in ``xvfb-run``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import os
+import resource
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from typing import Dict, List, Optional
+
+from benchmarks.input_replay import Event, dispatch_event, generate_stream
+
+
+def current_rss() -> int:
+	"""Resident set size in bytes; falls back to peak RSS where /proc is unavailable."""
+	try:
+		with open("/proc/self/statm") as handle:
+			return int(handle.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+	except (OSError, ValueError, IndexError):
+		peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+		return peak if sys.platform == "darwin" else peak * 1024
+
+
+def object_counts() -> Counter:
+	return Counter(type(obj).__name__ for obj in gc.get_objects())
+
+
+def memory_growth(first: Dict[str, object], last: Dict[str, object]) -> Dict[str, int]:
+	"""Split RSS growth between two samples into traced Python, tracemalloc and native memory."""
+	rss = last["rss_bytes"] - first["rss_bytes"]
+	python = last["traced_bytes"] - first["traced_bytes"]
+	bookkeeping = last["tracemalloc_bytes"] - first["tracemalloc_bytes"]
+	return {"rss": rss, "python": python, "tracemalloc": bookkeeping, "native": rss - python - bookkeeping}
+
+
+class SoakRunner:
+	"""Runs form cycles from a Clock interval and samples resource usage.
+
+	Events that switch screens end the frame's work, and the runner resumes only
+	once the transition is no longer active, so every FadeTransition runs to
+	completion instead of being restarted by the next event in the same frame.
+	"""
+
+	SCREEN_EVENTS = ("new", "submit")
+
+	def __init__(self, app, args, on_done):
+		self.app = app
+		self.args = args
+		self.on_done = on_done
+		self.session: List[Event] = generate_stream(1, args.seed)
+		self.cycles = 0
+		self._position = 0
+		self.samples: List[Dict[str, object]] = []
+		self._baseline_counts: Optional[Counter] = None
+		self._baseline_snapshot: Optional[tracemalloc.Snapshot] = None
+		self._last_counts: Optional[Counter] = None
+		self._last_snapshot: Optional[tracemalloc.Snapshot] = None
+		self._start = 0.0
+		self._next_sample = 0.0
+
+	def start(self) -> None:
+		from kivy.clock import Clock
+
+		self._start = time.perf_counter()
+		Clock.schedule_interval(self._tick, 0)
+
+	def _tick(self, _dt):
+		if self.app.screen_manager.transition.is_active:
+			return True
+		if self._position < len(self.session):
+			self.advance()
+			return True
+		self.finish_cycle()
+		elapsed = time.perf_counter() - self._start
+		if self.cycles >= self.args.warmup_cycles and elapsed >= self._next_sample:
+			self.sample(elapsed)
+			self._next_sample = elapsed + self.args.sample_interval
+		done = elapsed >= self.args.duration or (self.args.cycles and self.cycles >= self.args.cycles)
+		if done:
+			self.sample(elapsed)
+			self.on_done(self.report())
+			return False
+		return True
+
+	def advance(self) -> None:
+		"""Dispatch the cycle's events up to and including the next screen switch."""
+		while self._position < len(self.session):
+			event = self.session[self._position]
+			self._position += 1
+			dispatch_event(self.app, event)
+			if event["type"] in self.SCREEN_EVENTS:
+				return
+
+	def finish_cycle(self) -> None:
+		app = self.app
+		if not self.args.keep_entries:
+			entry_id = app.entries.last_id
+			if entry_id is not None:
+				app.delete_entries([entry_id])
+				app.history.forget(entry_id)
+				app.refresh_list_view()
+		self._position = 0
+		self.cycles += 1
+
+	def sample(self, elapsed: float) -> None:
+		from kivy.clock import Clock
+
+		gc.collect()
+		counts = object_counts()
+		snapshot = tracemalloc.take_snapshot()
+		if self._baseline_counts is None:
+			self._baseline_counts, self._baseline_snapshot = counts, snapshot
+		self._last_counts, self._last_snapshot = counts, snapshot
+		self.samples.append(
+			{
+				"elapsed_s": elapsed,
+				"cycles": self.cycles,
+				"rss_bytes": current_rss(),
+				"objects": sum(counts.values()),
+				"clock_events": len(Clock.get_events()),
+				"entries": len(self.app.entries),
+				"traced_bytes": tracemalloc.get_traced_memory()[0],
+				"tracemalloc_bytes": tracemalloc.get_tracemalloc_memory(),
+			}
+		)
+
+	def report(self) -> Dict[str, object]:
+		args = self.args
+		first, last = self.samples[0], self.samples[-1]
+		type_growth = self._last_counts.copy()
+		type_growth.subtract(self._baseline_counts)
+		top_types = [(name, delta) for name, delta in type_growth.most_common(args.top) if delta > 0]
+		stats = self._last_snapshot.compare_to(self._baseline_snapshot, "traceback")
+		growth_sites = []
+		for stat in stats[: args.top]:
+			if stat.size_diff <= 0:
+				continue
+			growth_sites.append(
+				{
+					"size_diff": stat.size_diff,
+					"count_diff": stat.count_diff,
+					"traceback": [f"{frame.filename}:{frame.lineno}" for frame in stat.traceback],
+				}
+			)
+		growth = memory_growth(first, last)
+		middle = self.samples[(len(self.samples) - 1) // 2]
+		late_growth = memory_growth(middle, last)
+		late_cycles = last["cycles"] - middle["cycles"]
+		projected = late_growth["rss"] * (last["cycles"] - first["cycles"]) // late_cycles if late_cycles else 0
+		clock_growth = last["clock_events"] - first["clock_events"]
+		failures = []
+		if projected > args.max_rss_growth_mb * 1024 * 1024:
+			failures.append(
+				f"RSS grew {late_growth['rss'] / 1048576:.1f} MB over the last {late_cycles} cycles, "
+				f"{projected / 1048576:.1f} MB over the run at that rate (limit {args.max_rss_growth_mb} MB): "
+				f"{late_growth['python'] / 1048576:+.1f} MB Python allocations, "
+				f"{late_growth['native'] / 1048576:+.1f} MB native memory tracemalloc cannot attribute"
+			)
+		for name, delta in top_types:
+			if delta > args.max_object_growth:
+				failures.append(f"{delta} more {name} objects (limit {args.max_object_growth})")
+		if clock_growth > args.max_clock_growth:
+			failures.append(f"{clock_growth} more scheduled Clock events (limit {args.max_clock_growth})")
+		return {
+			"cycles": self.cycles,
+			"samples": self.samples,
+			"memory_growth_bytes": growth,
+			"late_memory_growth_bytes": late_growth,
+			"late_cycles": late_cycles,
+			"projected_rss_growth_bytes": projected,
+			"clock_event_growth": clock_growth,
+			"object_growth": top_types,
+			"allocation_growth": growth_sites,
+			"failures": failures,
+		}
+
+
+def format_report(report: Dict[str, object]) -> str:
+	first, last = report["samples"][0], report["samples"][-1]
+	lines = [
+		f"{report['cycles']} cycles in {last['elapsed_s']:.0f} s",
+		f"RSS {first['rss_bytes'] / 1048576:.1f} MB -> {last['rss_bytes'] / 1048576:.1f} MB",
+		f"{'memory growth':<34} {'whole run':>10} {'last ' + str(report['late_cycles']) + ' cycles':>16}",
+	]
+	whole, late = report["memory_growth_bytes"], report["late_memory_growth_bytes"]
+	for key, label in (
+		("rss", "RSS"),
+		("python", "  Python allocations (tracemalloc)"),
+		("tracemalloc", "  tracemalloc bookkeeping"),
+		("native", "  native, not attributable"),
+	):
+		lines.append(f"{label:<34} {whole[key] / 1048576:+7.1f} MB {late[key] / 1048576:+13.1f} MB")
+	lines += [
+		f"RSS growth projected over the run from the last {report['late_cycles']} cycles: "
+		f"{report['projected_rss_growth_bytes'] / 1048576:+.1f} MB",
+		f"objects {first['objects']} -> {last['objects']}",
+		f"clock events {first['clock_events']} -> {last['clock_events']}",
+		"",
+		"object types that grew:",
+	]
+	lines.extend(f"  {name:<30} +{delta}" for name, delta in report["object_growth"])
+	lines.append("")
+	lines.append("allocation sites that grew (Python allocations only):")
+	for site in report["allocation_growth"]:
+		lines.append(f"  +{site['size_diff'] / 1024:.1f} KiB in {site['count_diff']:+d} blocks")
+		lines.extend(f"      {frame}" for frame in site["traceback"])
+	lines.append("")
+	if report["failures"]:
+		lines.extend(f"FAIL: {failure}" for failure in report["failures"])
+	else:
+		lines.append("PASS")
+	return "\n".join(lines)
+
+
+def run_soak(args) -> Dict[str, object]:
+	os.environ.setdefault("KIVY_NO_ARGS", "1")
+	os.environ.setdefault("KIVY_NO_CONSOLELOG", "1")
+	tracemalloc.start(args.trace_frames)
+
+	import main  # configures Kivy and loads the KV rules
+
+	result: Dict[str, object] = {}
+
+	class SoakApp(main.DemographicsApp):
+		def on_start(self):
+			super().on_start()
+			# Clock holds interval callbacks weakly, so the app must keep the runner alive.
+			self.soak_runner = SoakRunner(self, args, self._on_done)
+			self.soak_runner.start()
+
+		def _on_done(self, report):
+			result.update(report)
+			self.stop()
+
+	SoakApp().run()
+	tracemalloc.stop()
+	return result
+
+
+def main_cli(argv: List[str]) -> int:
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+	parser.add_argument("--duration", type=float, default=3600, help="seconds to run")
+	parser.add_argument("--cycles", type=int, default=0, help="stop after this many cycles (0 = no limit)")
+	parser.add_argument("--warmup-cycles", type=int, default=50)
+	parser.add_argument("--sample-interval", type=float, default=60)
+	parser.add_argument("--keep-entries", action="store_true", help="keep submitted entries instead of deleting them")
+	parser.add_argument("--max-rss-growth-mb", type=float, default=32)
+	parser.add_argument("--max-object-growth", type=int, default=1000, help="per object type")
+	parser.add_argument("--max-clock-growth", type=int, default=8)
+	parser.add_argument("--trace-frames", type=int, default=8)
+	parser.add_argument("--top", type=int, default=15)
+	parser.add_argument("--seed", type=int, default=0)
+	parser.add_argument("--report", help="write the full report as JSON")
+	args = parser.parse_args(argv)
+
+	report = run_soak(args)
+	print(format_report(report))
+	if args.report:
+		with open(args.report, "w") as handle:
+			json.dump(report, handle, indent=2)
+	return 1 if report["failures"] else 0
+
+
+if __name__ == "__main__":
+	sys.exit(main_cli(sys.argv[1:]))
@@ -0,0 +1,196 @@
+"""Measure what logging adds to DemographicsApp.handle_form_submit when the log sink is slow.
+
+Run from the repository root::
+
+    python -m benchmarks.submit_logging [--submits 2000 --write-delay 0.005]
+
+The sink sleeps ``--write-delay`` seconds per line to imitate a slow
+stdout/journald pipe. The same burst of submits goes through
+``handle_form_submit`` three times: with logging disabled, with a synchronous
+``print`` of every record, and with ``SubmissionLogger`` at its default queue
+size. Each submitted entry is deleted again outside the timed region so every
+submit sees the same list. For the logger the report also shows how many
+records were written and how many were dropped because the queue was full.
+Exits non-zero if ``SubmissionLogger`` adds more than ``--max-p99-ms`` to the
+p99 submit latency. ``--logger-only`` times ``SubmissionLogger.log`` alone
+without starting Kivy. Without a display, wrap the command in ``xvfb-run``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import os
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from submission_log import StreamSink, SubmissionLogger
+
+
+class ThrottledStream(io.StringIO):
+	"""In-memory stream that takes ``delay`` seconds per line written."""
+
+	def __init__(self, delay: float):
+		super().__init__()
+		self.delay = delay
+
+	def write(self, text: str) -> int:
+		time.sleep(self.delay * text.count("\n"))
+		return super().write(text)
+
+
+class NullLogger:
+	"""Stands in for SubmissionLogger with logging disabled."""
+
+	dropped = 0
+
+	def start(self) -> None:
+		pass
+
+	def log(self, event: str, payload: Optional[Dict[str, object]] = None, **fields: object) -> bool:
+		return True
+
+	def close(self, timeout: Optional[float] = None) -> bool:
+		return True
+
+
+class PrintLogger(NullLogger):
+	"""Writes every record synchronously on the submit path, like the old ``print(payload)``."""
+
+	def __init__(self, stream: io.StringIO):
+		self.stream = stream
+
+	def log(self, event: str, payload: Optional[Dict[str, object]] = None, **fields: object) -> bool:
+		self.stream.write(json.dumps({"event": event, "payload": payload, **fields}, default=str) + "\n")
+		return True
+
+
+def sample_payload(idx: int) -> Dict[str, object]:
+	return {
+		"first_name": f"First{idx}",
+		"last_name": f"Last{idx}",
+		"age_range": "25-34",
+		"genders_selected": ["Non-binary"],
+		"phone_number": "(555) 123-4567",
+	}
+
+
+def measure(
+	submit: Callable[[Dict[str, object]], None],
+	submits: int,
+	interval: float,
+	after: Optional[Callable[[], None]] = None,
+) -> List[float]:
+	samples = []
+	for idx in range(submits):
+		payload = sample_payload(idx)
+		start = time.perf_counter()
+		submit(payload)
+		samples.append(time.perf_counter() - start)
+		if after is not None:
+			after()
+		if interval:
+			time.sleep(interval)
+	return samples
+
+
+def percentiles(samples: List[float]) -> Tuple[float, float, float]:
+	ordered = sorted(samples)
+	p50 = ordered[len(ordered) // 2]
+	p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+	return p50, p99, ordered[-1]
+
+
+def summarize(name: str, samples: List[float]) -> float:
+	p50, p99, worst = percentiles(samples)
+	print(f"{name:<18} p50 {p50 * 1e3:8.3f} ms  p99 {p99 * 1e3:8.3f} ms  max {worst * 1e3:8.3f} ms")
+	return p99
+
+
+def close_and_count(logger: SubmissionLogger, stream: io.StringIO, timeout: float) -> str:
+	finished = logger.close(timeout=timeout)
+	written = stream.getvalue().count("\n")
+	status = "" if finished else f" (sink still busy after {timeout:.0f} s)"
+	return f"records written {written}, dropped {logger.dropped}{status}"
+
+
+def run_app(args) -> Dict[str, object]:
+	os.environ.setdefault("KIVY_NO_ARGS", "1")
+	os.environ.setdefault("KIVY_NO_CONSOLELOG", "1")
+
+	import main  # configures Kivy and loads the KV rules
+
+	result: Dict[str, object] = {}
+
+	class SubmitApp(main.DemographicsApp):
+		def on_start(self):
+			super().on_start()
+			self.submission_log.close(timeout=1)
+			try:
+				result.update(self.run_all())
+			finally:
+				self.stop()
+
+		def discard_last(self) -> None:
+			entry_id = self.entries.last_id
+			self.delete_entries([entry_id])
+			self.history.forget(entry_id)
+			self.entries.compact()
+			self.refresh_list_view()
+
+		def run_with(self, logger) -> List[float]:
+			self.submission_log = logger
+			logger.start()
+			return measure(self.handle_form_submit, args.submits, args.interval, self.discard_last)
+
+		def run_all(self) -> Dict[str, object]:
+			self.run_with(NullLogger())  # warm up KV, caches and the list view
+			baseline = self.run_with(NullLogger())
+			sync_stream = ThrottledStream(args.write_delay)
+			sync = self.run_with(PrintLogger(sync_stream))
+			async_stream = ThrottledStream(args.write_delay)
+			logger = SubmissionLogger(StreamSink(async_stream))
+			samples = self.run_with(logger)
+			counts = close_and_count(logger, async_stream, args.close_timeout)
+			self.submission_log = NullLogger()
+			return {"baseline": baseline, "print": sync, "logger": samples, "counts": counts}
+
+	SubmitApp().run()
+	return result
+
+
+def main_cli(argv: List[str]) -> int:
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+	parser.add_argument("--submits", type=int, default=2000)
+	parser.add_argument("--write-delay", type=float, default=0.005, help="seconds the sink takes per line")
+	parser.add_argument("--interval", type=float, default=0.0, help="seconds between submits")
+	parser.add_argument("--max-p99-ms", type=float, default=1.0, help="allowed p99 latency added by SubmissionLogger")
+	parser.add_argument("--close-timeout", type=float, default=10.0, help="seconds to wait for the queue to drain")
+	parser.add_argument("--logger-only", action="store_true", help="time SubmissionLogger.log without the app")
+	args = parser.parse_args(argv)
+
+	if args.logger_only:
+		async_stream = ThrottledStream(args.write_delay)
+		logger = SubmissionLogger(StreamSink(async_stream))
+		logger.start()
+		p99 = summarize("SubmissionLogger", measure(lambda payload: logger.log("submit", payload), args.submits, args.interval))
+		print(close_and_count(logger, async_stream, args.close_timeout))
+		added = p99
+	else:
+		result = run_app(args)
+		base_p99 = summarize("no logging", result["baseline"])
+		summarize("print(record)", result["print"])
+		added = summarize("SubmissionLogger", result["logger"]) - base_p99
+		print(result["counts"])
+		print(f"p99 added by SubmissionLogger {added * 1e3:.3f} ms")
+
+	if added * 1e3 > args.max_p99_ms:
+		print("FAIL: submit path blocked on logging")
+		return 1
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main_cli(sys.argv[1:]))
@@ -0,0 +1,129 @@
+"""Per-entry version history stored as field-level deltas with periodic snapshots.
+
+Each recorded version stores only the fields that changed since the previous
+version. Every ``snapshot_interval`` versions a full copy of the entry is kept
+as well, so reconstructing any version replays at most ``snapshot_interval - 1``
+deltas.
+
+This module does not import Kivy so it can be used by tooling and benchmarks.
+"""
+
+from __future__ import annotations
+
+import time
+from array import array
+from typing import Dict, Hashable, List, NamedTuple, Optional, Tuple
+
+Entry = Dict[str, object]
+Delta = Tuple[Tuple[str, object], ...]
+
+DEFAULT_SNAPSHOT_INTERVAL = 16
+
+
+class _Removed:
+	"""Marks a field that was removed from the entry in a delta."""
+
+	__slots__ = ()
+
+	def __repr__(self) -> str:
+		return "<removed>"
+
+
+REMOVED = _Removed()
+
+
+class VersionInfo(NamedTuple):
+	version: int
+	timestamp: float
+	changed_fields: Tuple[str, ...]
+
+
+class _EntryLog:
+	__slots__ = ("latest", "snapshots", "deltas", "timestamps")
+
+	def __init__(self) -> None:
+		self.latest: Entry = {}
+		self.snapshots: List[Entry] = []
+		self.deltas: List[Delta] = []
+		self.timestamps = array("d")
+
+
+def diff_entries(old: Entry, new: Entry) -> Delta:
+	changes = [(field, value) for field, value in new.items() if field not in old or old[field] != value]
+	changes.extend((field, REMOVED) for field in old if field not in new)
+	return tuple(changes)
+
+
+def apply_delta(entry: Entry, delta: Delta) -> None:
+	for field, value in delta:
+		if value is REMOVED:
+			entry.pop(field, None)
+		else:
+			entry[field] = value
+
+
+class EntryHistory:
+	"""Audit trail of every version of every entry, keyed by an entry key."""
+
+	def __init__(self, snapshot_interval: int = DEFAULT_SNAPSHOT_INTERVAL):
+		if snapshot_interval < 1:
+			raise ValueError("snapshot_interval must be at least 1")
+		self.snapshot_interval = snapshot_interval
+		self._logs: Dict[Hashable, _EntryLog] = {}
+
+	def __contains__(self, key: Hashable) -> bool:
+		return key in self._logs
+
+	def __len__(self) -> int:
+		return len(self._logs)
+
+	def record(self, key: Hashable, entry: Entry, timestamp: Optional[float] = None) -> int:
+		"""Record ``entry`` as the newest version for ``key`` and return its version number.
+
+		Submitting an unchanged entry does not create a new version.
+		"""
+		log = self._logs.get(key)
+		if log is None:
+			log = self._logs[key] = _EntryLog()
+		delta = diff_entries(log.latest, entry)
+		if not delta and log.deltas:
+			return len(log.deltas) - 1
+		version = len(log.deltas)
+		log.deltas.append(delta)
+		log.timestamps.append(time.time() if timestamp is None else timestamp)
+		apply_delta(log.latest, delta)
+		if version % self.snapshot_interval == 0:
+			log.snapshots.append(dict(log.latest))
+		return version
+
+	def version_count(self, key: Hashable) -> int:
+		log = self._logs.get(key)
+		return len(log.deltas) if log is not None else 0
+
+	def get(self, key: Hashable, version: int = -1) -> Entry:
+		"""Reconstruct ``version`` of the entry; negative versions count from the newest."""
+		log = self._logs[key]
+		count = len(log.deltas)
+		if version < 0:
+			version += count
+		if not 0 <= version < count:
+			raise IndexError(f"Entry {key!r} has no version {version}")
+		if version == count - 1:
+			return dict(log.latest)
+		base = (version // self.snapshot_interval) * self.snapshot_interval
+		entry = dict(log.snapshots[base // self.snapshot_interval])
+		for delta in log.deltas[base + 1:version + 1]:
+			apply_delta(entry, delta)
+		return entry
+
+	def versions(self, key: Hashable) -> List[VersionInfo]:
+		log = self._logs.get(key)
+		if log is None:
+			return []
+		return [
+			VersionInfo(version, log.timestamps[version], tuple(field for field, _value in delta))
+			for version, delta in enumerate(log.deltas)
+		]
+
+	def forget(self, key: Hashable) -> None:
+		self._logs.pop(key, None)
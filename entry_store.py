@@ -0,0 +1,134 @@
+"""Entry storage with stable IDs, tombstone deletes and incremental compaction.
+
+Entries live in a positional slot list so iteration keeps insertion order.
+Deleting an entry only replaces its slot with a tombstone and drops its ID from
+the position index, so deletes are O(1) and never renumber other entries.
+``compact_step`` reclaims tombstoned slots a bounded number at a time, which
+lets the app spread compaction over frames instead of pausing the UI.
+
+This module does not import Kivy so it can be used by tooling and benchmarks.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+Entry = Dict[str, object]
+
+DEFAULT_COMPACT_BUDGET = 256
+
+
+class EntryStore:
+	"""Ordered collection of entries addressed by stable integer IDs."""
+
+	def __init__(self, min_tombstones: int = 64, tombstone_ratio: float = 0.25):
+		self.min_tombstones = min_tombstones
+		self.tombstone_ratio = tombstone_ratio
+		self._slots: List[Optional[Entry]] = []
+		self._slot_ids: List[int] = []
+		self._positions: Dict[int, int] = {}
+		self._next_id = 1
+		self._tombstones = 0
+		self._compact_read: Optional[int] = None
+		self._compact_write = 0
+		self._compact_residual = 0  # tombstones created behind the write cursor mid-compaction
+
+	def __len__(self) -> int:
+		return len(self._positions)
+
+	def __contains__(self, entry_id: object) -> bool:
+		return entry_id in self._positions
+
+	def __iter__(self) -> Iterator[Tuple[int, Entry]]:
+		for entry_id, entry in zip(self._slot_ids, self._slots):
+			if entry is not None:
+				yield entry_id, entry
+
+	@property
+	def tombstones(self) -> int:
+		return self._tombstones
+
+	@property
+	def last_id(self) -> Optional[int]:
+		"""ID handed out by the most recent add(), whether or not it was deleted since."""
+		return self._next_id - 1 if self._next_id > 1 else None
+
+	@property
+	def capacity(self) -> int:
+		return len(self._slots)
+
+	def add(self, entry: Entry) -> int:
+		entry_id = self._next_id
+		self._next_id += 1
+		self._positions[entry_id] = len(self._slots)
+		self._slots.append(entry)
+		self._slot_ids.append(entry_id)
+		return entry_id
+
+	def get(self, entry_id: int) -> Entry:
+		entry = self._slots[self._positions[entry_id]]
+		assert entry is not None
+		return entry
+
+	def update(self, entry_id: int, entry: Entry) -> None:
+		self._slots[self._positions[entry_id]] = entry
+
+	def delete(self, entry_id: int) -> bool:
+		position = self._positions.pop(entry_id, None)
+		if position is None:
+			return False
+		self._slots[position] = None
+		self._tombstones += 1
+		if self._compact_read is not None and position < self._compact_write:
+			self._compact_residual += 1
+		return True
+
+	def delete_many(self, entry_ids: Iterable[int]) -> int:
+		return sum(1 for entry_id in entry_ids if self.delete(entry_id))
+
+	def needs_compaction(self) -> bool:
+		if self._compact_read is not None:
+			return True
+		return self._tombstones >= max(self.min_tombstones, int(len(self._slots) * self.tombstone_ratio))
+
+	def compact_step(self, budget: int = DEFAULT_COMPACT_BUDGET) -> bool:
+		"""Move up to ``budget`` slots towards the front; return True while work remains.
+
+		Slots before the write cursor are compacted and slots from the read cursor
+		on are untouched, so lookups, adds and deletes stay valid between steps.
+		"""
+		if self._compact_read is None:
+			if not self._tombstones:
+				return False
+			self._compact_read = 0
+			self._compact_write = 0
+			self._compact_residual = 0
+		slots, slot_ids, positions = self._slots, self._slot_ids, self._positions
+		read, write = self._compact_read, self._compact_write
+		end = min(len(slots), read + budget)
+		while read < end:
+			entry = slots[read]
+			if entry is not None:
+				if read != write:
+					entry_id = slot_ids[read]
+					slots[write] = entry
+					slot_ids[write] = entry_id
+					positions[entry_id] = write
+					slots[read] = None
+				write += 1
+			read += 1
+		if read < len(slots):
+			self._compact_read, self._compact_write = read, write
+			return True
+		del slots[write:]
+		del slot_ids[write:]
+		self._tombstones = self._compact_residual
+		self._compact_residual = 0
+		self._compact_read = None
+		self._compact_write = 0
+		return False
+
+	def compact(self) -> None:
+		"""Finish any compaction in progress and reclaim every tombstone now."""
+		while self.compact_step(len(self._slots) or 1) or self._tombstones:
+			pass
@@ -0,0 +1,249 @@
+"""Declarative form schemas and their precompiled validators.
+
+A :class:`FormSchema` describes the fields of an intake form. ``compile_schema``
+turns it into a :class:`CompiledSchema` holding the regexes, input filters,
+validators and payload builders for every field. Compilation is cached per
+schema, so every form widget built from the same schema shares one set of
+compiled closures instead of recompiling them per instance.
+
+This module does not import Kivy so it can be used by tooling and benchmarks.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
+
+TEXT = "text"
+PHONE = "phone"
+CHOICE = "choice"
+MULTI = "multi"
+
+FIELD_KINDS = (TEXT, PHONE, CHOICE, MULTI)
+
+PHONE_DIGITS = 10
+
+_digits_only = re.compile(r"\D")
+
+Validator = Callable[[object], bool]
+InputFilter = Callable[[str, bool], str]
+Normalizer = Callable[[object], object]
+
+
+def extract_digits(value: str) -> str:
+	return _digits_only.sub("", value)
+
+
+def format_phone(digits: str) -> str:
+	area, prefix, line = digits[:3], digits[3:6], digits[6:]
+	return f"({area}) {prefix}-{line}"
+
+
+@dataclass(frozen=True)
+class FieldSpec:
+	"""A single form field.
+
+	``allowed_chars`` is a regex character-class body used to filter typed input;
+	``pattern`` must fully match the stripped value of a text field. Fields that
+	share a ``group`` are laid out side by side under the first member's label.
+	"""
+
+	name: str
+	label: str
+	kind: str = TEXT
+	required: bool = True
+	hint: str = ""
+	pattern: Optional[str] = None
+	allowed_chars: Optional[str] = None
+	options: Tuple[str, ...] = ()
+	prompt: str = "Select an option"
+	note: str = ""
+	group: Optional[str] = None
+	widget_id: Optional[str] = None
+
+	def __post_init__(self) -> None:
+		if self.kind not in FIELD_KINDS:
+			raise ValueError(f"Unknown field kind {self.kind!r} for field {self.name!r}")
+		if self.kind in (CHOICE, MULTI) and not self.options:
+			raise ValueError(f"Field {self.name!r} of kind {self.kind!r} needs options")
+
+	@property
+	def id(self) -> str:
+		return self.widget_id or self.name
+
+
+@dataclass(frozen=True)
+class FormSchema:
+	"""An ordered collection of fields plus the form's heading text."""
+
+	title: str
+	fields: Tuple[FieldSpec, ...]
+	description: str = "Fields marked with * are required."
+
+	def __post_init__(self) -> None:
+		names = [spec.name for spec in self.fields]
+		if len(names) != len(set(names)):
+			raise ValueError(f"Duplicate field names in schema {self.title!r}")
+
+	def field(self, name: str) -> FieldSpec:
+		for spec in self.fields:
+			if spec.name == name:
+				return spec
+		raise KeyError(name)
+
+	def group_members(self, group: str) -> List[FieldSpec]:
+		return [spec for spec in self.fields if spec.group == group]
+
+
+class CompiledSchema:
+	"""Validators, input filters and payload builders generated for a schema."""
+
+	def __init__(self, schema: FormSchema):
+		self.schema = schema
+		self.validators: Dict[str, Validator] = {}
+		self.filters: Dict[str, InputFilter] = {}
+		self.normalizers: Dict[str, Normalizer] = {}
+		for spec in schema.fields:
+			self.validators[spec.name] = _make_validator(spec)
+			self.normalizers[spec.name] = _make_normalizer(spec)
+			input_filter = _make_input_filter(spec)
+			if input_filter is not None:
+				self.filters[spec.name] = input_filter
+		self._checks: Tuple[Tuple[str, Validator], ...] = tuple(self.validators.items())
+
+	def is_complete(self, values: Mapping[str, object]) -> bool:
+		return all(check(values[name]) for name, check in self._checks)
+
+	def invalid_fields(self, values: Mapping[str, object]) -> List[str]:
+		return [name for name, check in self._checks if not check(values[name])]
+
+	def payload(self, values: Mapping[str, object]) -> Dict[str, object]:
+		return {name: normalize(values[name]) for name, normalize in self.normalizers.items()}
+
+
+@lru_cache(maxsize=None)
+def compile_schema(schema: FormSchema) -> CompiledSchema:
+	return CompiledSchema(schema)
+
+
+def _make_input_filter(spec: FieldSpec) -> Optional[InputFilter]:
+	allowed = spec.allowed_chars
+	if allowed is None and spec.kind == PHONE:
+		allowed = r"0-9()\-\s"
+	if allowed is None:
+		return None
+	invalid_chars = re.compile(f"[^{allowed}]")
+
+	def input_filter(substring: str, from_undo: bool) -> str:  # noqa: ARG001
+		return invalid_chars.sub("", substring)
+
+	return input_filter
+
+
+def _make_validator(spec: FieldSpec) -> Validator:
+	required = spec.required
+	if spec.kind == TEXT:
+		pattern = re.compile(spec.pattern) if spec.pattern else None
+
+		def valid_text(value: object) -> bool:
+			stripped = str(value).strip()
+			if not stripped:
+				return not required
+			return pattern is None or pattern.fullmatch(stripped) is not None
+
+		return valid_text
+
+	if spec.kind == PHONE:
+
+		def valid_phone(value: object) -> bool:
+			digits = extract_digits(str(value))
+			if not digits:
+				return not required
+			return len(digits) == PHONE_DIGITS
+
+		return valid_phone
+
+	options = frozenset(spec.options)
+	if spec.kind == CHOICE:
+
+		def valid_choice(value: object) -> bool:
+			if value in options:
+				return True
+			return not required and value in ("", spec.prompt)
+
+		return valid_choice
+
+	def valid_multi(value: object) -> bool:
+		selected = set(value)  # type: ignore[call-overload]
+		if not selected:
+			return not required
+		return selected <= options
+
+	return valid_multi
+
+
+def _make_normalizer(spec: FieldSpec) -> Normalizer:
+	if spec.kind == TEXT:
+		return lambda value: str(value).strip()
+	if spec.kind == PHONE:
+
+		def normalize_phone(value: object) -> object:
+			text = str(value)
+			digits = extract_digits(text)
+			return format_phone(digits) if len(digits) == PHONE_DIGITS else text
+
+		return normalize_phone
+	if spec.kind == CHOICE:
+		return lambda value: value
+	return lambda value: sorted(value)  # type: ignore[call-overload]
+
+
+_NAME_PATTERN = r"[A-Za-z][A-Za-z\s'\-]*"
+_NAME_CHARS = r"A-Za-z\s'\-"
+
+DEMOGRAPHICS_SCHEMA = FormSchema(
+	title="Demographics Entry",
+	description="Provide your information below. Fields marked with * are required.",
+	fields=(
+		FieldSpec(
+			name="first_name",
+			label="Name",
+			hint="First name",
+			pattern=_NAME_PATTERN,
+			allowed_chars=_NAME_CHARS,
+			group="name",
+		),
+		FieldSpec(
+			name="last_name",
+			label="Name",
+			hint="Last name",
+			pattern=_NAME_PATTERN,
+			allowed_chars=_NAME_CHARS,
+			group="name",
+		),
+		FieldSpec(
+			name="age_range",
+			label="Age range",
+			kind=CHOICE,
+			options=("18-24", "25-34", "35-44", "45-54", "55+"),
+			prompt="Select age range",
+			widget_id="age_spinner",
+		),
+		FieldSpec(
+			name="genders_selected",
+			label="Gender (check all that apply)",
+			kind=MULTI,
+			options=("Woman/girl", "Man/boy", "Non-binary", "Two-Spirit", "Prefer not to say"),
+			note="Based on SOGI practice guidance, please select all that apply.",
+		),
+		FieldSpec(
+			name="phone_number",
+			label="Phone number",
+			kind=PHONE,
+			hint="(555) 555-5555",
+			widget_id="phone_input",
+		),
+	),
+)
@@ -97,6 +97,9 @@ Additional Info:
     values of config_kivy(), as well as responding correctly to simulation mode being enabled to allow for
     accurate window resize behavior, including when dragging the window between displays of different density.
 
+    config_kivy_args_from_env() builds config_kivy() arguments from KIVY_HELPER_* environment variables, so a
+    parent process can launch an app under a different window size or simulated device.
+
 """
 
 __author__ = "Jeff Wilson, PhD"
@@ -214,3 +217,28 @@ def config_kivy(window_width=None, window_height=None,
             exit(0)
 
     return target_window_width, target_window_height
+
+
+SIMULATION_ENV_VARS = {
+    'window_width': 'KIVY_HELPER_WINDOW_WIDTH',
+    'window_height': 'KIVY_HELPER_WINDOW_HEIGHT',
+    'simulate_dpi': 'KIVY_HELPER_SIMULATE_DPI',
+    'simulate_density': 'KIVY_HELPER_SIMULATE_DENSITY',
+}
+
+
+def config_kivy_args_from_env(**defaults):
+    """ Return keyword arguments for config_kivy(), letting KIVY_HELPER_* environment variables override defaults.
+
+    This lets a parent process (e.g. a benchmark runner) launch the app under a different window size or simulated
+    device without editing the call site. Setting both KIVY_HELPER_SIMULATE_DPI and KIVY_HELPER_SIMULATE_DENSITY
+    turns on simulate_device.
+    """
+    kwargs = dict(defaults)
+    for key, env_name in SIMULATION_ENV_VARS.items():
+        value = os.environ.get(env_name)
+        if value:
+            kwargs[key] = float(value) if key == 'simulate_density' else int(value)
+    if kwargs.get('simulate_dpi') and kwargs.get('simulate_density'):
+        kwargs['simulate_device'] = True
+    return kwargs
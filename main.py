@@ -2,12 +2,28 @@
 
 from __future__ import annotations
 
-import re
-from typing import Dict, List, Optional
-
-from kivy_config_helper import config_kivy
-
-config_kivy(window_width=400, window_height=500)
+from functools import partial
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from kivy_config_helper import config_kivy, config_kivy_args_from_env
+from entry_history import EntryHistory
+from entry_store import EntryStore
+from submission_log import SubmissionLogger
+from form_schema import (
+	CHOICE,
+	DEMOGRAPHICS_SCHEMA,
+	MULTI,
+	PHONE,
+	PHONE_DIGITS,
+	CompiledSchema,
+	FieldSpec,
+	compile_schema,
+	extract_digits,
+	format_phone,
+)
+
+config_kivy(**config_kivy_args_from_env(window_width=400, window_height=500))
 
 import kivy
 
@@ -15,13 +31,16 @@ kivy.require("2.3.0")
 
 from kivy.app import App
 from kivy.clock import Clock
+from kivy.factory import Factory
 from kivy.lang import Builder
 from kivy.metrics import dp
-from kivy.properties import BooleanProperty, ListProperty, NumericProperty, StringProperty
+from kivy.properties import BooleanProperty, NumericProperty, ObjectProperty, StringProperty
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.button import Button
 from kivy.uix.screenmanager import Screen, ScreenManager, FadeTransition
 from kivy.uix.checkbox import CheckBox
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.widget import Widget
 
 KV = """
 #:import dp kivy.metrics.dp
@@ -36,9 +55,9 @@ KV = """
 	valign: 'middle'
 	text_size: self.width - dp(20), self.height
 	background_normal: ''
-	background_color: (0.94, 0.95, 0.98, 1)
+	background_color: (0.78, 0.86, 0.96, 1) if self.selected else (0.94, 0.95, 0.98, 1)
 	color: 0.12, 0.12, 0.2, 1
-	on_release: app.open_entry(self.entry_index)
+	on_release: app.on_entry_row_release(self.entry_id)
 
 <StylizedLabel@Label>:
 	size_hint_y: None
@@ -85,11 +104,32 @@ KV = """
 			size_hint_y: None
 			height: dp(52)
 			padding: 0, 0, 0, 0
+			spacing: dp(8)
 			Label:
 				text: "Demographics Entries"
 				bold: True
 				font_size: sp(20)
 				color: 0.05, 0.2, 0.35, 1
+			Button:
+				text: f"Delete ({root.selected_count})"
+				size_hint_x: None
+				width: dp(96) if root.selecting else 0
+				opacity: 1 if root.selecting else 0
+				disabled: not root.selecting or not root.selected_count
+				font_size: sp(15)
+				background_normal: ''
+				background_color: 0.75, 0.2, 0.2, 1
+				color: 1, 1, 1, 1
+				on_release: app.delete_selected_entries()
+			Button:
+				text: "Done" if root.selecting else "Select"
+				size_hint_x: None
+				width: dp(72)
+				font_size: sp(15)
+				background_normal: ''
+				background_color: 0.05, 0.2, 0.35, 1
+				color: 1, 1, 1, 1
+				on_release: app.toggle_selection_mode()
 			Button:
 				text: '+'
 				size_hint_x: None
@@ -110,7 +150,7 @@ KV = """
 			color: 0.25, 0.25, 0.3, 1
 			opacity: 1
 			font_size: sp(14)
-		RecycleView:
+		ListRecycleView:
 			id: entries_rv
 			viewclass: 'EntryRow'
 			bar_width: dp(6)
@@ -125,10 +165,166 @@ KV = """
 
 <FormScreen>:
 	name: 'form'
-	DemographicsForm:
-		id: form_widget
+	BoxLayout:
+		orientation: 'vertical'
+		BoxLayout:
+			size_hint_y: None
+			height: dp(40) if root.editing else 0
+			opacity: 1 if root.editing else 0
+			disabled: not root.editing
+			spacing: dp(8)
+			Button:
+				text: "View edit history"
+				font_size: sp(15)
+				background_normal: ''
+				background_color: 0.05, 0.2, 0.35, 1
+				color: 1, 1, 1, 1
+				on_release: app.open_history()
+			Button:
+				text: "Delete entry"
+				size_hint_x: None
+				width: dp(120)
+				font_size: sp(15)
+				background_normal: ''
+				background_color: 0.75, 0.2, 0.2, 1
+				color: 1, 1, 1, 1
+				on_release: app.delete_current_entry()
+		DemographicsForm:
+			id: form_widget
+
+<HistoryRow>:
+	size_hint_y: None
+	height: dp(48)
+	padding: dp(14), 0
+	halign: 'left'
+	valign: 'middle'
+	text_size: self.width - dp(20), self.height
+	background_normal: ''
+	background_color: (0.94, 0.95, 0.98, 1)
+	color: 0.12, 0.12, 0.2, 1
+	on_release: app.show_history_version(self.version)
+
+<HistoryScreen>:
+	name: 'history'
+	BoxLayout:
+		orientation: 'vertical'
+		padding: dp(16)
+		spacing: dp(12)
+		canvas.before:
+			Color:
+				rgba: 1, 1, 1, 1
+			RoundedRectangle:
+				pos: self.pos
+				size: self.size
+				radius: [dp(8)]
+		BoxLayout:
+			size_hint_y: None
+			height: dp(52)
+			Button:
+				text: '<'
+				size_hint_x: None
+				width: dp(52)
+				font_size: sp(24)
+				background_normal: ''
+				background_color: 0.05, 0.2, 0.35, 1
+				color: 1, 1, 1, 1
+				on_release: app.close_history()
+			Label:
+				text: root.title
+				bold: True
+				font_size: sp(20)
+				color: 0.05, 0.2, 0.35, 1
+		ListRecycleView:
+			id: versions_rv
+			viewclass: 'HistoryRow'
+			bar_width: dp(6)
+			data: []
+			RecycleBoxLayout:
+				default_size: None, dp(48)
+				default_size_hint: 1, None
+				size_hint_y: None
+				height: self.minimum_height
+				orientation: 'vertical'
+				spacing: dp(6)
+		Label:
+			text: root.detail
+			size_hint_y: None
+			text_size: self.width, None
+			height: self.texture_size[1] + dp(12)
+			halign: 'left'
+			valign: 'top'
+			color: 0.12, 0.12, 0.2, 1
+			font_size: sp(14)
+
+<FormTitle@Label>:
+	size_hint_y: None
+	height: self.texture_size[1] + dp(12)
+	font_size: sp(22)
+	bold: True
+	color: 0.05, 0.2, 0.35, 1
+
+<FormDescription@Label>:
+	text_size: self.width, None
+	size_hint_y: None
+	height: self.texture_size[1]
+	color: 0.25, 0.25, 0.3, 1
+	font_size: sp(14)
+
+<FormFieldRow@BoxLayout>:
+	size_hint_y: None
+	height: dp(44)
+	spacing: dp(10)
 
-<DemographicsForm>:
+<FormSpinner@Spinner>:
+	size_hint_y: None
+	height: dp(44)
+	font_size: sp(16)
+	background_normal: ''
+	background_color: 0.96, 0.97, 0.99, 1
+	color: 0.12, 0.12, 0.2, 1
+	option_cls: 'FormSpinnerOption'
+
+<FormOptionGroup>:
+	orientation: 'vertical'
+	size_hint_y: None
+	height: self.minimum_height
+	padding: dp(12)
+	spacing: dp(8)
+	canvas.before:
+		Color:
+			rgba: 0.92, 0.95, 0.99, 1
+		RoundedRectangle:
+			pos: self.pos
+			size: self.size
+			radius: [dp(8)]
+	Label:
+		text: root.note
+		size_hint_y: None
+		text_size: self.width - dp(24), None
+		halign: 'left'
+		valign: 'middle'
+		height: (self.texture_size[1] + dp(6)) if root.note else 0
+		opacity: 1 if root.note else 0
+		color: 0.2, 0.25, 0.35, 1
+		font_size: sp(13)
+
+<FormOptionRow>:
+	size_hint_y: None
+	height: dp(32)
+	spacing: dp(6)
+	CheckBox:
+		id: check
+		size_hint: None, None
+		size: dp(24), dp(24)
+	Label:
+		text: root.text
+		font_size: sp(14)
+		color: 0.12, 0.12, 0.18, 1
+		halign: 'left'
+		valign: 'middle'
+		text_size: self.size
+
+<SchemaForm>:
 	orientation: 'vertical'
 	padding: dp(18)
 	spacing: dp(14)
@@ -150,161 +346,6 @@ KV = """
 			height: self.minimum_height
 			padding: 0, 0, 0, dp(20)
 			spacing: dp(12)
-			Label:
-				text: "Demographics Entry"
-				size_hint_y: None
-				height: self.texture_size[1] + dp(12)
-				font_size: sp(22)
-				bold: True
-				color: 0.05, 0.2, 0.35, 1
-			Label:
-				text: "Provide your information below. Fields marked with * are required."
-				text_size: self.width, None
-				size_hint_y: None
-				height: self.texture_size[1]
-				color: 0.25, 0.25, 0.3, 1
-				font_size: sp(14)
-			StylizedLabel:
-				text: "Name*"
-			BoxLayout:
-				size_hint_y: None
-				height: dp(44)
-				spacing: dp(10)
-				FormTextInput:
-					id: first_name
-					hint_text: "First name"
-				FormTextInput:
-					id: last_name
-					hint_text: "Last name"
-			StylizedLabel:
-				text: "Age range*"
-			Spinner:
-				id: age_spinner
-				size_hint_y: None
-				height: dp(44)
-				font_size: sp(16)
-				text: root.age_prompt
-				values: root.age_options
-				background_normal: ''
-				background_color: 0.96, 0.97, 0.99, 1
-				color: 0.12, 0.12, 0.2, 1
-				option_cls: 'FormSpinnerOption'
-			StylizedLabel:
-				text: "Gender (check all that apply)*"
-			BoxLayout:
-				orientation: 'vertical'
-				size_hint_y: None
-				height: self.minimum_height
-				padding: dp(12)
-				spacing: dp(8)
-				canvas.before:
-					Color:
-						rgba: 0.92, 0.95, 0.99, 1
-					RoundedRectangle:
-						pos: self.pos
-						size: self.size
-						radius: [dp(8)]
-				Label:
-					text: "Based on SOGI practice guidance, please select all that apply."
-					size_hint_y: None
-					text_size: self.width - dp(24), None
-					halign: 'left'
-					valign: 'middle'
-					height: self.texture_size[1] + dp(6)
-					color: 0.2, 0.25, 0.35, 1
-					font_size: sp(13)
-				GridLayout:
-					cols: 2
-					size_hint_y: None
-					height: self.minimum_height
-					row_default_height: dp(32)
-					row_force_default: True
-					spacing: dp(6)
-					BoxLayout:
-						size_hint_y: None
-						height: dp(32)
-						spacing: dp(6)
-						CheckBox:
-							id: gender_woman
-							size_hint: None, None
-							size: dp(24), dp(24)
-							on_active: root.on_gender_toggle('Woman/girl', self.active)
-						Label:
-							text: "Woman / girl"
-							font_size: sp(14)
-							color: 0.12, 0.12, 0.18, 1
-							halign: 'left'
-							valign: 'middle'
-							text_size: self.size
-					BoxLayout:
-						size_hint_y: None
-						height: dp(32)
-						spacing: dp(6)
-						CheckBox:
-							id: gender_man
-							size_hint: None, None
-							size: dp(24), dp(24)
-							on_active: root.on_gender_toggle('Man/boy', self.active)
-						Label:
-							text: "Man / boy"
-							font_size: sp(14)
-							color: 0.12, 0.12, 0.18, 1
-							halign: 'left'
-							valign: 'middle'
-							text_size: self.size
-					BoxLayout:
-						size_hint_y: None
-						height: dp(32)
-						spacing: dp(6)
-						CheckBox:
-							id: gender_nb
-							size_hint: None, None
-							size: dp(24), dp(24)
-							on_active: root.on_gender_toggle('Non-binary', self.active)
-						Label:
-							text: "Non-binary"
-							font_size: sp(14)
-							color: 0.12, 0.12, 0.18, 1
-							halign: 'left'
-							valign: 'middle'
-							text_size: self.size
-					BoxLayout:
-						size_hint_y: None
-						height: dp(32)
-						spacing: dp(6)
-						CheckBox:
-							id: gender_two_spirit
-							size_hint: None, None
-							size: dp(24), dp(24)
-							on_active: root.on_gender_toggle('Two-Spirit', self.active)
-						Label:
-							text: "Two-Spirit"
-							font_size: sp(14)
-							color: 0.12, 0.12, 0.18, 1
-							halign: 'left'
-							valign: 'middle'
-							text_size: self.size
-					BoxLayout:
-						size_hint_y: None
-						height: dp(32)
-						spacing: dp(6)
-						CheckBox:
-							id: gender_prefer_no
-							size_hint: None, None
-							size: dp(24), dp(24)
-							on_active: root.on_gender_toggle('Prefer not to say', self.active)
-						Label:
-							text: "Prefer not to say"
-							font_size: sp(14)
-							color: 0.12, 0.12, 0.18, 1
-							halign: 'left'
-							valign: 'middle'
-							text_size: self.size
-			StylizedLabel:
-				text: "Phone number*"
-			FormTextInput:
-				id: phone_input
-				hint_text: "(555) 555-5555"
 
 	BoxLayout:
 		size_hint_y: None
@@ -330,15 +371,29 @@ KV = """
 """
 
 
+class ListRecycleView(RecycleView):
+	"""RecycleView whose scroll bar does not collect a binding on every refresh."""
+
+	def update_from_scroll(self, *largs):
+		# Kivy 2.3 binds bar_color on every call but unbinds it once per 0.5 s fade, so each
+		# refresh within that window would leak a binding for the life of the screen.
+		self.funbind("bar_color", self._change_bar_color)
+		super().update_from_scroll(*largs)
+
+
 class EntryRow(Button):
 	"""Button row used inside the RecycleView."""
 
-	entry_index = NumericProperty(-1)
+	entry_id = NumericProperty(-1)
+	selected = BooleanProperty(False)
 
 
 class ListScreen(Screen):
 	"""Displays stored entries in a scrollable list."""
 
+	selecting = BooleanProperty(False)
+	selected_count = NumericProperty(0)
+
 	def update_rows(self, rows: List[Dict[str, object]]) -> None:
 		if not hasattr(self, "ids"):
 			return
@@ -356,6 +411,8 @@ class ListScreen(Screen):
 class FormScreen(Screen):
 	"""Hosts the demographics form for creating or editing entries."""
 
+	editing = BooleanProperty(False)
+
 	def load_entry(self, entry: Optional[Dict[str, object]]) -> None:
 		self.ids.form_widget.load_entry(entry)
 
@@ -364,155 +421,196 @@ class FormScreen(Screen):
 		return self.ids.form_widget
 
 
-class DemographicsForm(BoxLayout):
-	"""Collects demographics data with inline validation."""
+class HistoryRow(Button):
+	"""Button row listing one version of an entry."""
 
-	age_options = ListProperty(
-		[
-			"18-24",
-			"25-34",
-			"35-44",
-			"45-54",
-			"55+",
-		]
-	)
-	age_prompt = StringProperty("Select age range")
-	submit_disabled = BooleanProperty(True)
+	version = NumericProperty(-1)
+
+
+class HistoryScreen(Screen):
+	"""Lists the recorded versions of an entry and shows the selected one."""
+
+	title = StringProperty("Edit history")
+	detail = StringProperty("")
+
+	def update_versions(self, title: str, rows: List[Dict[str, object]]) -> None:
+		self.title = title
+		self.detail = ""
+		self.ids.versions_rv.data = rows
+
+
+class FormOptionGroup(BoxLayout):
+	"""Panel holding the checkbox rows of a multi-select field."""
+
+	note = StringProperty("")
+
+
+class FormOptionRow(BoxLayout):
+	"""Checkbox with its option label."""
 
-	_invalid_name_chars = re.compile(r"[^A-Za-z\s'\-]")
-	_invalid_phone_chars = re.compile(r"[^0-9()\-\s]")
-	_digits_only = re.compile(r"\D")
-	_name_pattern = re.compile(r"^[A-Za-z][A-Za-z\s'\-]*$")
+	text = StringProperty("")
+
+
+class SchemaForm(BoxLayout):
+	"""Form whose widgets, validation and payload are generated from a FormSchema."""
+
+	schema = ObjectProperty(None, allownone=True)
+	submit_disabled = BooleanProperty(True)
 
 	def __init__(self, **kwargs):
-		super().__init__(**kwargs)
-		self.selected_genders: set[str] = set()
-		self.gender_checkboxes: Dict[str, CheckBox] = {}
+		self._compiled: Optional[CompiledSchema] = None
+		self.field_widgets: Dict[str, Widget] = {}
+		self.selections: Dict[str, set[str]] = {}
+		self.option_checkboxes: Dict[str, Dict[str, CheckBox]] = {}
+		self._generated_ids: List[str] = []
 		self._formatting_phone = False
 		self._loading_entry = False
+		super().__init__(**kwargs)
 
 	def on_kv_post(self, base_widget):
 		super().on_kv_post(base_widget)
-		Clock.schedule_once(self._bind_inputs, 0)
-
-	def _bind_inputs(self, *_):
-		for field in (self.ids.first_name, self.ids.last_name):
-			field.bind(text=self._on_name_text)
-			field.input_filter = self._name_input_filter
-		phone_input = self.ids.phone_input
-		phone_input.bind(text=self._on_phone_text, focus=self.on_phone_focus)
-		phone_input.input_filter = self._phone_input_filter
-		spinner = self.ids.age_spinner
-		spinner.bind(text=self.on_age_selected)
-		self.gender_checkboxes = {
-			"Woman/girl": self.ids.gender_woman,
-			"Man/boy": self.ids.gender_man,
-			"Non-binary": self.ids.gender_nb,
-			"Two-Spirit": self.ids.gender_two_spirit,
-			"Prefer not to say": self.ids.gender_prefer_no,
-		}
-		self._update_submit_state()
-
-	def _name_input_filter(self, substring: str, from_undo: bool) -> str:  # noqa: ARG002
-		return self._invalid_name_chars.sub("", substring)
+		self.bind(schema=self._build_fields)
+		self._build_fields()
 
-	def _phone_input_filter(self, substring: str, from_undo: bool) -> str:  # noqa: ARG002
-		return self._invalid_phone_chars.sub("", substring)
-
-	def _on_name_text(self, _instance, _value):  # noqa: ARG002
+	@property
+	def compiled(self) -> CompiledSchema:
+		if self._compiled is None:
+			raise RuntimeError("Form schema has not been built yet")
+		return self._compiled
+
+	def _build_fields(self, *_):
+		container = self.ids.form_container
+		container.clear_widgets()
+		for widget_id in self._generated_ids:
+			self.ids.pop(widget_id, None)
+		self._generated_ids = []
+		self.field_widgets = {}
+		self.selections = {}
+		self.option_checkboxes = {}
+		if self.schema is None:
+			self._compiled = None
+			return
+		self._compiled = compile_schema(self.schema)
+		self._add_field_widgets(container)
 		self._update_submit_state()
 
-	def _on_phone_text(self, _instance, _value):  # noqa: ARG002
+	def _add_field_widgets(self, container: Widget) -> None:
+		container.add_widget(Factory.FormTitle(text=self.schema.title))
+		if self.schema.description:
+			container.add_widget(Factory.FormDescription(text=self.schema.description))
+		rendered_groups = set()
+		for spec in self.schema.fields:
+			if spec.group is None:
+				container.add_widget(self._field_label(spec))
+				container.add_widget(self._make_field_widget(spec))
+				continue
+			if spec.group in rendered_groups:
+				continue
+			rendered_groups.add(spec.group)
+			container.add_widget(self._field_label(spec))
+			row = Factory.FormFieldRow()
+			for member in self.schema.group_members(spec.group):
+				row.add_widget(self._make_field_widget(member))
+			container.add_widget(row)
+
+	def _field_label(self, spec: FieldSpec) -> Widget:
+		return Factory.StylizedLabel(text=f"{spec.label}*" if spec.required else spec.label)
+
+	def _make_field_widget(self, spec: FieldSpec) -> Widget:
+		compiled = self.compiled
+		if spec.kind == CHOICE:
+			widget = Factory.FormSpinner(text=spec.prompt, values=list(spec.options))
+			widget.bind(text=self.on_choice_selected)
+		elif spec.kind == MULTI:
+			widget = Factory.FormOptionGroup(note=spec.note)
+			self.selections[spec.name] = set()
+			checkboxes: Dict[str, CheckBox] = {}
+			for option in spec.options:
+				row = Factory.FormOptionRow(text=option)
+				checkbox = row.ids.check
+				checkbox.bind(active=partial(self._on_option_active, spec.name, option))
+				checkboxes[option] = checkbox
+				widget.add_widget(row)
+			self.option_checkboxes[spec.name] = checkboxes
+		else:
+			widget = Factory.FormTextInput(hint_text=spec.hint)
+			widget.bind(text=self._on_field_text)
+			if spec.kind == PHONE:
+				widget.bind(focus=self.on_phone_focus)
+			input_filter = compiled.filters.get(spec.name)
+			if input_filter is not None:
+				widget.input_filter = input_filter
+		self.field_widgets[spec.name] = widget
+		self.ids[spec.id] = widget
+		self._generated_ids.append(spec.id)
+		return widget
+
+	def _on_field_text(self, _instance, _value):  # noqa: ARG002
 		if not self._formatting_phone:
 			self._update_submit_state()
 
-	def on_phone_focus(self, _instance, focused):
+	def on_phone_focus(self, instance, focused):
 		if not focused:
-			digits = self._extract_digits(self.ids.phone_input.text)
-			if len(digits) == 10:
-				formatted = self._format_phone(digits)
+			digits = extract_digits(instance.text)
+			if len(digits) == PHONE_DIGITS:
 				self._formatting_phone = True
-				self.ids.phone_input.text = formatted
+				instance.text = format_phone(digits)
 				self._formatting_phone = False
 		self._update_submit_state()
 
-	def on_age_selected(self, _spinner, _value):  # noqa: ARG002
+	def on_choice_selected(self, _spinner, _value):  # noqa: ARG002
 		self._update_submit_state()
 
-	def on_gender_toggle(self, label: str, active: bool) -> None:
+	def _on_option_active(self, field: str, option: str, _checkbox, active: bool) -> None:
+		self.on_option_toggle(field, option, active)
+
+	def on_option_toggle(self, field: str, option: str, active: bool) -> None:
+		selected = self.selections[field]
 		if active:
-			self.selected_genders.add(label)
+			selected.add(option)
 		else:
-			self.selected_genders.discard(label)
+			selected.discard(option)
 		if not self._loading_entry:
 			self._update_submit_state()
 
 	def load_entry(self, entry: Optional[Dict[str, object]]) -> None:
+		entry = entry or {}
 		self._loading_entry = True
 		try:
-			if entry is None:
-				self.ids.first_name.text = ""
-				self.ids.last_name.text = ""
-				self.ids.age_spinner.text = self.age_prompt
-				self.selected_genders.clear()
-				for checkbox in self.gender_checkboxes.values():
-					checkbox.active = False
-				self.ids.phone_input.text = ""
-			else:
-				self.ids.first_name.text = str(entry.get("first_name", ""))
-				self.ids.last_name.text = str(entry.get("last_name", ""))
-				age_value = str(entry.get("age_range", self.age_prompt))
-				self.ids.age_spinner.text = age_value if age_value in self.age_options else self.age_prompt
-				self.selected_genders = set(map(str, entry.get("genders_selected", [])))
-				for label, checkbox in self.gender_checkboxes.items():
-					checkbox.active = label in self.selected_genders
-				self.ids.phone_input.text = str(entry.get("phone_number", ""))
+			for spec in self.compiled.schema.fields:
+				widget = self.field_widgets[spec.name]
+				if spec.kind == CHOICE:
+					value = str(entry.get(spec.name, spec.prompt))
+					widget.text = value if value in spec.options else spec.prompt
+				elif spec.kind == MULTI:
+					selected = set(map(str, entry.get(spec.name, [])))
+					self.selections[spec.name] = selected
+					for option, checkbox in self.option_checkboxes[spec.name].items():
+						checkbox.active = option in selected
+				else:
+					widget.text = str(entry.get(spec.name, ""))
+					# Undo history would otherwise keep every keystroke of every previous entry.
+					widget.reset_undo()
 		finally:
 			self._loading_entry = False
 		self._update_submit_state()
 
-	def _valid_name(self, value: str) -> bool:
-		stripped = value.strip()
-		return bool(stripped and self._name_pattern.match(stripped))
-
-	def _valid_phone(self) -> bool:
-		digits = self._extract_digits(self.ids.phone_input.text)
-		return len(digits) == 10
-
-	def _extract_digits(self, value: str) -> str:
-		return self._digits_only.sub("", value)
-
-	def _format_phone(self, digits: str) -> str:
-		area, prefix, line = digits[:3], digits[3:6], digits[6:]
-		return f"({area}) {prefix}-{line}"
-
-	def _valid_age(self) -> bool:
-		return self.ids.age_spinner.text in self.age_options
+	def _values(self) -> Dict[str, object]:
+		values: Dict[str, object] = {}
+		for spec in self.compiled.schema.fields:
+			if spec.kind == MULTI:
+				values[spec.name] = self.selections[spec.name]
+			else:
+				values[spec.name] = self.field_widgets[spec.name].text
+		return values
 
 	def _update_submit_state(self) -> None:
-		first_ok = self._valid_name(self.ids.first_name.text)
-		last_ok = self._valid_name(self.ids.last_name.text)
-		ready = all(
-			[
-				first_ok,
-				last_ok,
-				self._valid_age(),
-				self.selected_genders,
-				self._valid_phone(),
-			]
-		)
-		self.submit_disabled = not ready
+		if self._compiled is None:
+			return
+		self.submit_disabled = not self._compiled.is_complete(self._values())
 
 	def _payload(self) -> Dict[str, object]:
-		digits = self._extract_digits(self.ids.phone_input.text)
-		formatted_phone = self._format_phone(digits) if len(digits) == 10 else self.ids.phone_input.text
-		return {
-			"first_name": self.ids.first_name.text.strip(),
-			"last_name": self.ids.last_name.text.strip(),
-			"age_range": self.ids.age_spinner.text,
-			"genders_selected": sorted(self.selected_genders),
-			"phone_number": formatted_phone,
-		}
+		return self.compiled.payload(self._values())
 
 	def submit_form(self) -> None:
 		if self.submit_disabled:
@@ -526,6 +624,19 @@ class DemographicsForm(BoxLayout):
 		app.handle_form_cancel()
 
 
+class DemographicsForm(SchemaForm):
+	"""Collects demographics data with inline validation."""
+
+	schema = ObjectProperty(DEMOGRAPHICS_SCHEMA, allownone=True)
+
+	@property
+	def selected_genders(self) -> set[str]:
+		return self.selections["genders_selected"]
+
+	def on_gender_toggle(self, label: str, active: bool) -> None:
+		self.on_option_toggle("genders_selected", label, active)
+
+
 Builder.load_string(KV)
 
 
@@ -534,14 +645,19 @@ class DemographicsApp(App):
 
 	def __init__(self, **kwargs):
 		super().__init__(**kwargs)
-		self.entries: List[Dict[str, object]] = []
-		self.editing_index: Optional[int] = None
+		self.entries = EntryStore()
+		self.editing_id: Optional[int] = None
+		self.selected_ids: set[int] = set()
+		self.history = EntryHistory()
+		self.submission_log = SubmissionLogger.from_env()
 		self._screen_manager: Optional[ScreenManager] = None
+		self._compaction_event = None
 
 	def build(self):  # noqa: D401
 		self._screen_manager = ScreenManager(transition=FadeTransition(duration=0.2))
 		self._screen_manager.add_widget(ListScreen(name="list"))
 		self._screen_manager.add_widget(FormScreen(name="form"))
+		self._screen_manager.add_widget(HistoryScreen(name="history"))
 		return self._screen_manager
 
 	@property
@@ -558,45 +674,139 @@ class DemographicsApp(App):
 	def form_screen(self) -> FormScreen:
 		return self.screen_manager.get_screen("form")  # type: ignore[return-value]
 
+	@property
+	def history_screen(self) -> HistoryScreen:
+		return self.screen_manager.get_screen("history")  # type: ignore[return-value]
+
 	def on_start(self):  # noqa: D401
+		self.submission_log.start()
 		self.refresh_list_view()
 
+	def on_stop(self):  # noqa: D401
+		self.submission_log.close()
+
 	def refresh_list_view(self) -> None:
 		rows = []
-		for idx, entry in enumerate(self.entries):
+		for position, (entry_id, entry) in enumerate(self.entries):
 			first = str(entry.get("first_name", "")).strip()
 			last = str(entry.get("last_name", "")).strip()
-			title = f"{first} {last}".strip() or f"Entry {idx + 1}"
-			rows.append({"text": title, "entry_index": idx})
+			title = f"{first} {last}".strip() or f"Entry {position + 1}"
+			rows.append({"text": title, "entry_id": entry_id, "selected": entry_id in self.selected_ids})
 		self.list_screen.update_rows(rows)
+		self.list_screen.selected_count = len(self.selected_ids)
 
 	def start_new_entry(self) -> None:
-		self.editing_index = None
+		self.editing_id = None
+		self.form_screen.editing = False
 		self.form_screen.load_entry(None)
 		self.screen_manager.current = "form"
 
-	def open_entry(self, index: int) -> None:
-		if 0 <= index < len(self.entries):
-			self.editing_index = index
-			self.form_screen.load_entry(self.entries[index])
+	def on_entry_row_release(self, entry_id: int) -> None:
+		if self.list_screen.selecting:
+			self.toggle_entry_selected(entry_id)
+		else:
+			self.open_entry(entry_id)
+
+	def open_entry(self, entry_id: int) -> None:
+		entry_id = int(entry_id)
+		if entry_id in self.entries:
+			self.editing_id = entry_id
+			self.form_screen.editing = True
+			self.form_screen.load_entry(self.entries.get(entry_id))
 			self.screen_manager.current = "form"
 
 	def handle_form_submit(self, payload: Dict[str, object]) -> None:
-		print(payload)
-		if self.editing_index is None:
-			self.entries.append(payload)
+		if self.editing_id is None:
+			entry_id = self.entries.add(payload)
 		else:
-			self.entries[self.editing_index] = payload
-		self.editing_index = None
+			entry_id = self.editing_id
+			self.entries.update(entry_id, payload)
+		version = self.history.record(entry_id, payload)
+		self.submission_log.log("submit", payload, entry_id=entry_id, version=version)
 		self.refresh_list_view()
-		self.form_screen.load_entry(None)
-		self.screen_manager.current = "list"
+		self._close_form()
 
 	def handle_form_cancel(self) -> None:
-		self.editing_index = None
+		self._close_form()
+
+	def _close_form(self) -> None:
+		self.editing_id = None
+		self.form_screen.editing = False
 		self.form_screen.load_entry(None)
 		self.screen_manager.current = "list"
 
+	def toggle_selection_mode(self) -> None:
+		self.list_screen.selecting = not self.list_screen.selecting
+		self.selected_ids.clear()
+		self.refresh_list_view()
+
+	def toggle_entry_selected(self, entry_id: int) -> None:
+		entry_id = int(entry_id)
+		if entry_id in self.selected_ids:
+			self.selected_ids.discard(entry_id)
+		elif entry_id in self.entries:
+			self.selected_ids.add(entry_id)
+		self.refresh_list_view()
+
+	def delete_entries(self, entry_ids: Iterable[int]) -> int:
+		"""Tombstone the given entries; their edit history is kept for auditing."""
+		deleted = [entry_id for entry_id in map(int, entry_ids) if self.entries.delete(entry_id)]
+		if deleted:
+			self.submission_log.log("delete", entry_ids=deleted)
+			self._schedule_compaction()
+		return len(deleted)
+
+	def delete_selected_entries(self) -> None:
+		self.delete_entries(self.selected_ids)
+		self.selected_ids.clear()
+		self.list_screen.selecting = False
+		self.refresh_list_view()
+
+	def delete_current_entry(self) -> None:
+		if self.editing_id is None:
+			return
+		self.delete_entries([self.editing_id])
+		self.selected_ids.discard(self.editing_id)
+		self.refresh_list_view()
+		self._close_form()
+
+	def _schedule_compaction(self) -> None:
+		if self._compaction_event is None and self.entries.needs_compaction():
+			self._compaction_event = Clock.schedule_interval(self._compact_step, 0)
+
+	def _compact_step(self, _dt):
+		if self.entries.compact_step():
+			return True
+		self._compaction_event = None
+		return False
+
+	def open_history(self) -> None:
+		if self.editing_id is None:
+			return
+		rows = []
+		for info in reversed(self.history.versions(self.editing_id)):
+			stamp = datetime.fromtimestamp(info.timestamp).strftime("%Y-%m-%d %H:%M:%S")
+			changed = ", ".join(info.changed_fields) if info.version else "created"
+			rows.append({"text": f"v{info.version + 1}  {stamp}  {changed}", "version": info.version})
+		entry = self.entries.get(self.editing_id)
+		title = f"{entry.get('first_name', '')} {entry.get('last_name', '')}".strip() or "Edit history"
+		self.history_screen.update_versions(title, rows)
+		self.screen_manager.current = "history"
+
+	def show_history_version(self, version: int) -> None:
+		if self.editing_id is None:
+			return
+		entry = self.history.get(self.editing_id, int(version))
+		lines = [f"Version {int(version) + 1}"]
+		for field, value in entry.items():
+			if isinstance(value, (list, tuple)):
+				value = ", ".join(map(str, value))
+			lines.append(f"{field}: {value}")
+		self.history_screen.detail = "\n".join(lines)
+
+	def close_history(self) -> None:
+		self.screen_manager.current = "form"
+
 
 if __name__ == "__main__":
 	DemographicsApp().run()
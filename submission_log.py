@@ -0,0 +1,213 @@
+"""Structured, asynchronous logging of form submissions.
+
+``SubmissionLogger.log`` only puts a record on a bounded queue and never
+blocks: when the queue is full the record is dropped and counted. A
+background thread drains the queue in batches, redacts configured PII fields,
+serializes each record as one JSON line and writes the batch to a sink.
+``RotatingFileSink`` rotates its file once it exceeds ``max_bytes``;
+``StreamSink`` writes to a stream such as stdout.
+
+This module does not import Kivy so it can be used by tooling and benchmarks.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, TextIO
+
+REDACTED = "[redacted]"
+DEFAULT_REDACT_FIELDS = ("phone_number",)
+
+
+class StreamSink:
+	"""Writes batches of JSON lines to a text stream."""
+
+	def __init__(self, stream: Optional[TextIO] = None):
+		self.stream = stream
+
+	def write_batch(self, lines: List[str]) -> None:
+		stream = self.stream or sys.stdout
+		stream.write("".join(lines))
+		stream.flush()
+
+	def close(self) -> None:
+		pass
+
+
+class RotatingFileSink:
+	"""Appends batches of JSON lines to a file, rotating it by size.
+
+	Rotated files are renamed ``path.1`` ... ``path.<backup_count>``; the oldest
+	is discarded.
+	"""
+
+	def __init__(self, path: str, max_bytes: int = 5 * 1024 * 1024, backup_count: int = 3):
+		self.path = path
+		self.max_bytes = max_bytes
+		self.backup_count = backup_count
+		self._handle: Optional[TextIO] = None
+		self._size = 0
+
+	def _open(self) -> TextIO:
+		if self._handle is None:
+			self._handle = open(self.path, "a", encoding="utf-8")
+			self._size = self._handle.tell()
+		return self._handle
+
+	def _rotate(self) -> None:
+		if self._handle is not None:
+			self._handle.close()
+			self._handle = None
+		if self.backup_count > 0:
+			for index in range(self.backup_count - 1, 0, -1):
+				source = f"{self.path}.{index}"
+				if os.path.exists(source):
+					os.replace(source, f"{self.path}.{index + 1}")
+			os.replace(self.path, f"{self.path}.1")
+		else:
+			os.remove(self.path)
+
+	def write_batch(self, lines: List[str]) -> None:
+		data = "".join(lines)
+		handle = self._open()
+		if self._size and self._size + len(data.encode("utf-8")) > self.max_bytes:
+			self._rotate()
+			handle = self._open()
+		handle.write(data)
+		handle.flush()
+		self._size += len(data.encode("utf-8"))
+
+	def close(self) -> None:
+		if self._handle is not None:
+			self._handle.close()
+			self._handle = None
+
+
+def redact(payload: Dict[str, object], fields: Iterable[str]) -> Dict[str, object]:
+	redacted = dict(payload)
+	for field in fields:
+		if field in redacted:
+			redacted[field] = REDACTED
+	return redacted
+
+
+class SubmissionLogger:
+	"""Queues submission records and writes them as JSON lines from a worker thread."""
+
+	def __init__(
+		self,
+		sink=None,
+		redact_fields: Iterable[str] = DEFAULT_REDACT_FIELDS,
+		max_queue: int = 1024,
+		batch_size: int = 64,
+		flush_interval: float = 0.25,
+	):
+		self.sink = sink if sink is not None else StreamSink()
+		self.redact_fields = tuple(redact_fields)
+		self.batch_size = batch_size
+		self.flush_interval = flush_interval
+		self.dropped = 0
+		self.write_errors = 0
+		self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+		self._thread: Optional[threading.Thread] = None
+		self._closing = threading.Event()
+
+	@classmethod
+	def from_env(cls) -> "SubmissionLogger":
+		"""Build a logger from DEMOGRAPHICS_LOG_* environment variables.
+
+		DEMOGRAPHICS_LOG_FILE selects a rotating file instead of stdout,
+		DEMOGRAPHICS_LOG_MAX_BYTES and DEMOGRAPHICS_LOG_BACKUPS control rotation,
+		and DEMOGRAPHICS_LOG_REDACT is a comma-separated list of fields to redact.
+		"""
+		path = os.environ.get("DEMOGRAPHICS_LOG_FILE")
+		if path:
+			sink = RotatingFileSink(
+				path,
+				max_bytes=int(os.environ.get("DEMOGRAPHICS_LOG_MAX_BYTES", 5 * 1024 * 1024)),
+				backup_count=int(os.environ.get("DEMOGRAPHICS_LOG_BACKUPS", 3)),
+			)
+		else:
+			sink = StreamSink()
+		redact_fields = os.environ.get("DEMOGRAPHICS_LOG_REDACT")
+		if redact_fields is None:
+			return cls(sink)
+		return cls(sink, redact_fields=[field.strip() for field in redact_fields.split(",") if field.strip()])
+
+	def start(self) -> None:
+		if self._thread is None:
+			self._thread = threading.Thread(target=self._run, name="submission-log", daemon=True)
+			self._thread.start()
+
+	def log(self, event: str, payload: Optional[Dict[str, object]] = None, **fields: object) -> bool:
+		"""Queue a record without blocking; return False if it was dropped."""
+		if self._closing.is_set():
+			self.dropped += 1
+			return False
+		try:
+			self._queue.put_nowait((time.time(), event, payload, fields))
+		except queue.Full:
+			self.dropped += 1
+			return False
+		return True
+
+	def close(self, timeout: Optional[float] = 5.0) -> bool:
+		"""Ask the worker to flush queued records and stop; wait at most ``timeout`` seconds.
+
+		Returns False if the worker is still stuck writing to a stalled sink when
+		the timeout expires; it is a daemon thread, so it will not keep the
+		process alive.
+		"""
+		self._closing.set()
+		thread, self._thread = self._thread, None
+		if thread is None:
+			return True
+		thread.join(timeout)
+		if thread.is_alive():
+			return False
+		self.sink.close()
+		return True
+
+	def _format(self, record) -> str:
+		timestamp, event, payload, fields = record
+		data: Dict[str, object] = {"ts": round(timestamp, 6), "event": event}
+		data.update(fields)
+		if payload is not None:
+			data["payload"] = redact(payload, self.redact_fields)
+		return json.dumps(data, default=str) + "\n"
+
+	def _write(self, batch: List[object]) -> None:
+		try:
+			self.sink.write_batch([self._format(record) for record in batch])
+		except Exception as exc:  # noqa: BLE001 - logging must never take down the worker
+			self.write_errors += 1
+			sys.stderr.write(f"submission log write failed: {exc}\n")
+
+	def _run(self) -> None:
+		pending = self._queue
+		closing = self._closing
+		while True:
+			try:
+				record = pending.get(timeout=self.flush_interval)
+			except queue.Empty:
+				if closing.is_set():
+					return
+				continue
+			batch = [record]
+			deadline = time.monotonic() + self.flush_interval
+			while len(batch) < self.batch_size:
+				remaining = deadline - time.monotonic()
+				try:
+					if remaining <= 0 or closing.is_set():
+						record = pending.get_nowait()
+					else:
+						record = pending.get(timeout=remaining)
+				except queue.Empty:
+					break
+				batch.append(record)
+			self._write(batch)
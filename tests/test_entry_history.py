@@ -0,0 +1,71 @@
+import pytest
+
+from entry_history import REMOVED, EntryHistory, apply_delta, diff_entries
+
+
+def test_diff_and_apply_round_trip():
+	old = {"first_name": "Ann", "age_range": "25-34", "phone_number": "(555) 123-4567"}
+	new = {"first_name": "Anne", "age_range": "25-34", "genders_selected": ["Woman/girl"]}
+	delta = diff_entries(old, new)
+	assert dict(delta) == {"first_name": "Anne", "genders_selected": ["Woman/girl"], "phone_number": REMOVED}
+	entry = dict(old)
+	apply_delta(entry, delta)
+	assert entry == new
+
+
+def test_record_returns_versions_and_skips_unchanged():
+	history = EntryHistory()
+	assert history.record(1, {"first_name": "Ann"}, timestamp=1.0) == 0
+	assert history.record(1, {"first_name": "Ann"}, timestamp=2.0) == 0
+	assert history.record(1, {"first_name": "Anne"}, timestamp=3.0) == 1
+	assert history.version_count(1) == 2
+	assert history.versions(1) == [(0, 1.0, ("first_name",)), (1, 3.0, ("first_name",))]
+	assert 1 in history and len(history) == 1
+
+
+def test_get_reconstructs_every_version_across_snapshots():
+	history = EntryHistory(snapshot_interval=4)
+	submitted = []
+	for idx in range(23):
+		entry = {"first_name": f"Ann{idx}", "age_range": "25-34"}
+		if idx % 5 == 0:
+			entry["phone_number"] = f"{idx:010d}"
+		submitted.append(entry)
+		history.record("key", entry)
+	for version, entry in enumerate(submitted):
+		assert history.get("key", version) == entry
+	assert history.get("key") == submitted[-1]
+	assert history.get("key", -2) == submitted[-2]
+
+
+def test_get_returns_copies():
+	history = EntryHistory()
+	history.record(1, {"first_name": "Ann"})
+	history.get(1)["first_name"] = "Mutated"
+	assert history.get(1) == {"first_name": "Ann"}
+
+
+def test_get_out_of_range():
+	history = EntryHistory()
+	history.record(1, {"first_name": "Ann"})
+	with pytest.raises(IndexError):
+		history.get(1, 1)
+	with pytest.raises(IndexError):
+		history.get(1, -2)
+	with pytest.raises(KeyError):
+		history.get(2)
+
+
+def test_forget_and_unknown_keys():
+	history = EntryHistory()
+	history.record(1, {"first_name": "Ann"})
+	history.forget(1)
+	history.forget(2)
+	assert 1 not in history
+	assert history.version_count(1) == 0
+	assert history.versions(1) == []
+
+
+def test_snapshot_interval_must_be_positive():
+	with pytest.raises(ValueError):
+		EntryHistory(snapshot_interval=0)
@@ -0,0 +1,131 @@
+import random
+
+import pytest
+
+from entry_store import EntryStore
+
+
+def make_store(count: int, **kwargs) -> EntryStore:
+	store = EntryStore(**kwargs)
+	for idx in range(count):
+		store.add({"idx": idx})
+	return store
+
+
+def slot_tombstones(store: EntryStore) -> int:
+	return sum(1 for entry in store._slots if entry is None)
+
+
+def assert_consistent(store: EntryStore, expected: dict) -> None:
+	assert list(store) == list(expected.items())
+	assert len(store) == len(expected)
+	for entry_id, entry in expected.items():
+		assert entry_id in store
+		assert store.get(entry_id) is entry
+	assert store.tombstones == slot_tombstones(store)
+
+
+def test_delete_leaves_tombstone_and_keeps_ids():
+	store = make_store(5)
+	assert store.delete(2)
+	assert not store.delete(2)
+	assert 2 not in store
+	assert store.tombstones == 1
+	assert store.capacity == 5
+	assert [entry_id for entry_id, _entry in store] == [1, 3, 4, 5]
+	assert store.get(4) == {"idx": 3}
+	with pytest.raises(KeyError):
+		store.get(2)
+
+
+def test_last_id_survives_delete():
+	store = EntryStore()
+	assert store.last_id is None
+	store.add({})
+	entry_id = store.add({})
+	store.delete(entry_id)
+	assert store.last_id == entry_id
+	assert store.add({}) == entry_id + 1
+
+
+def test_needs_compaction_threshold():
+	store = make_store(100, min_tombstones=10, tombstone_ratio=0.25)
+	store.delete_many(range(1, 25))
+	assert not store.needs_compaction()
+	store.delete(25)
+	assert store.needs_compaction()
+
+
+def test_compact_reclaims_every_slot():
+	store = make_store(50)
+	store.delete_many(range(1, 51, 3))
+	expected = dict(store)
+	store.compact()
+	assert store.tombstones == 0
+	assert store.capacity == len(store)
+	assert_consistent(store, expected)
+
+
+def test_compact_step_is_bounded():
+	store = make_store(100)
+	store.delete_many(range(1, 101, 2))
+	expected = dict(store)
+	steps = 0
+	while store.compact_step(budget=10):
+		steps += 1
+		assert_consistent(store, expected)
+	assert steps == 9
+	assert store.capacity == 50
+	assert_consistent(store, expected)
+
+
+def test_delete_behind_write_cursor_stays_counted():
+	store = make_store(20)
+	store.delete_many([1, 2])
+	assert store.compact_step(budget=10)
+	# Entry 5 already moved to the compacted prefix, entry 15 is still ahead of the read cursor.
+	store.delete(5)
+	store.delete(15)
+	assert not store.compact_step(budget=100)
+	assert store.tombstones == 1 == slot_tombstones(store)
+	store.compact()
+	assert store.tombstones == 0
+	assert store.capacity == len(store) == 16
+
+
+def test_add_during_compaction():
+	store = make_store(10)
+	store.delete_many([1, 3])
+	assert store.compact_step(budget=4)
+	new_id = store.add({"idx": "new"})
+	store.compact()
+	assert [entry_id for entry_id, _entry in store][-1] == new_id
+	assert store.get(new_id) == {"idx": "new"}
+	assert store.capacity == len(store) == 9
+
+
+def test_random_operations_match_reference():
+	rng = random.Random(0)
+	store = EntryStore(min_tombstones=4, tombstone_ratio=0.2)
+	expected = {}
+	for step in range(5000):
+		action = rng.random()
+		if action < 0.45 or not expected:
+			entry = {"step": step}
+			expected[store.add(entry)] = entry
+		elif action < 0.8:
+			entry_id = rng.choice(list(expected))
+			assert store.delete(entry_id)
+			del expected[entry_id]
+		elif action < 0.9:
+			entry_id = rng.choice(list(expected))
+			entry = {"step": step}
+			store.update(entry_id, entry)
+			expected[entry_id] = entry
+		elif store.needs_compaction():
+			store.compact_step(budget=rng.randint(1, 16))
+		assert store.tombstones == slot_tombstones(store)
+	assert_consistent(store, expected)
+	store.compact()
+	assert store.capacity == len(expected)
+	assert_consistent(store, expected)
@@ -0,0 +1,118 @@
+import pytest
+
+from form_schema import (
+	CHOICE,
+	DEMOGRAPHICS_SCHEMA,
+	MULTI,
+	PHONE,
+	FieldSpec,
+	FormSchema,
+	compile_schema,
+	extract_digits,
+	format_phone,
+)
+
+COMPILED = compile_schema(DEMOGRAPHICS_SCHEMA)
+
+
+def valid_values(**overrides):
+	values = {
+		"first_name": "Ann",
+		"last_name": "O'Neil-Lee",
+		"age_range": "25-34",
+		"genders_selected": ["Woman/girl"],
+		"phone_number": "555.123.4567",
+	}
+	values.update(overrides)
+	return values
+
+
+def test_phone_helpers():
+	assert extract_digits("(555) 123-4567") == "5551234567"
+	assert format_phone("5551234567") == "(555) 123-4567"
+
+
+def test_complete_form():
+	values = valid_values()
+	assert COMPILED.is_complete(values)
+	assert COMPILED.invalid_fields(values) == []
+
+
+@pytest.mark.parametrize(
+	"field, value",
+	[
+		("first_name", ""),
+		("first_name", "   "),
+		("first_name", "Ann2"),
+		("last_name", "-Lee"),
+		("age_range", "Select age range"),
+		("age_range", "99+"),
+		("genders_selected", []),
+		("genders_selected", ["Woman/girl", "Other"]),
+		("phone_number", "555-1234"),
+		("phone_number", ""),
+	],
+)
+def test_invalid_values(field, value):
+	values = valid_values(**{field: value})
+	assert not COMPILED.is_complete(values)
+	assert COMPILED.invalid_fields(values) == [field]
+
+
+def test_optional_fields_accept_blank():
+	schema = FormSchema(
+		title="Optional",
+		fields=(
+			FieldSpec(name="nickname", label="Nickname", required=False, pattern=r"[a-z]+"),
+			FieldSpec(name="phone", label="Phone", kind=PHONE, required=False),
+			FieldSpec(name="size", label="Size", kind=CHOICE, options=("S", "M"), required=False, prompt="Pick"),
+			FieldSpec(name="tags", label="Tags", kind=MULTI, options=("a", "b"), required=False),
+		),
+	)
+	compiled = compile_schema(schema)
+	assert compiled.is_complete({"nickname": " ", "phone": "", "size": "Pick", "tags": []})
+	assert compiled.invalid_fields({"nickname": "Nick", "phone": "123", "size": "L", "tags": ["c"]}) == [
+		"nickname",
+		"phone",
+		"size",
+		"tags",
+	]
+
+
+def test_payload_normalizes_values():
+	payload = COMPILED.payload(valid_values(first_name="  Ann ", genders_selected={"Non-binary", "Man/boy"}))
+	assert payload == {
+		"first_name": "Ann",
+		"last_name": "O'Neil-Lee",
+		"age_range": "25-34",
+		"genders_selected": ["Man/boy", "Non-binary"],
+		"phone_number": "(555) 123-4567",
+	}
+	assert COMPILED.payload(valid_values(phone_number="555-1234"))["phone_number"] == "555-1234"
+
+
+def test_input_filters():
+	assert COMPILED.filters["first_name"]("Ann3 O'Neil!", False) == "Ann O'Neil"
+	assert COMPILED.filters["phone_number"]("(555) abc-1234", False) == "(555) -1234"
+	assert "age_range" not in COMPILED.filters
+
+
+def test_compile_schema_is_cached():
+	assert compile_schema(DEMOGRAPHICS_SCHEMA) is COMPILED
+
+
+def test_schema_lookup():
+	assert DEMOGRAPHICS_SCHEMA.field("age_range").id == "age_spinner"
+	assert DEMOGRAPHICS_SCHEMA.field("first_name").id == "first_name"
+	assert [spec.name for spec in DEMOGRAPHICS_SCHEMA.group_members("name")] == ["first_name", "last_name"]
+	with pytest.raises(KeyError):
+		DEMOGRAPHICS_SCHEMA.field("missing")
+
+
+def test_schema_definition_errors():
+	with pytest.raises(ValueError):
+		FieldSpec(name="x", label="X", kind="date")
+	with pytest.raises(ValueError):
+		FieldSpec(name="x", label="X", kind=CHOICE)
+	with pytest.raises(ValueError):
+		FormSchema(title="Dup", fields=(FieldSpec(name="x", label="X"), FieldSpec(name="x", label="Y")))
@@ -0,0 +1,143 @@
+"""Smoke checks that run main.py in a subprocess, since importing it configures Kivy."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from conftest import ROOT
+
+pytest.importorskip("kivy")
+
+MARKER = "SMOKE_OK"
+
+BUILD_FORM = f"""
+import main
+form = main.DemographicsForm()
+assert form.submit_disabled
+assert set(form.field_widgets) == {{spec.name for spec in main.DEMOGRAPHICS_SCHEMA.fields}}
+for widget_id in ("first_name", "last_name", "age_spinner", "phone_input"):
+	assert widget_id in form.ids, widget_id
+form.ids.first_name.text = "Ann"
+form.ids.last_name.text = "Lee"
+form.ids.age_spinner.text = "25-34"
+form.option_checkboxes["genders_selected"]["Man/boy"].active = True
+form.ids.phone_input.text = "5551234567"
+assert not form.submit_disabled
+assert form._payload()["phone_number"] == "(555) 123-4567"
+form.load_entry(None)
+assert form.submit_disabled and not form.selected_genders
+print("{MARKER}")
+"""
+
+BUILD_APP = """
+import main
+app = main.DemographicsApp()
+app.root = app.build()
+rows = lambda: app.list_screen.ids.entries_rv.data
+
+
+def payload(first_name, **fields):
+	entry = {
+		"first_name": first_name,
+		"last_name": "Lee",
+		"age_range": "25-34",
+		"genders_selected": ["Man/boy"],
+		"phone_number": "(555) 123-4567",
+	}
+	entry.update(fields)
+	return entry
+"""
+
+DELETE_ENTRIES = BUILD_APP + f"""
+from kivy.clock import Clock
+app.entries.min_tombstones = 2
+for idx in range(5):
+	app.handle_form_submit(payload(f"Ann{{idx}}"))
+assert [row["entry_id"] for row in rows()] == [1, 2, 3, 4, 5]
+
+app.toggle_selection_mode()
+assert app.list_screen.selecting
+for entry_id in (2, 4, 4, 3):
+	app.on_entry_row_release(entry_id)
+assert app.selected_ids == {{2, 3}} and app.list_screen.selected_count == 2
+assert [row["entry_id"] for row in rows() if row["selected"]] == [2, 3]
+app.delete_selected_entries()
+assert [row["entry_id"] for row in rows()] == [1, 4, 5]
+assert [row["text"] for row in rows()] == ["Ann0 Lee", "Ann3 Lee", "Ann4 Lee"]
+assert not app.list_screen.selecting and not app.selected_ids
+assert app.list_screen.selected_count == 0 and not any(row["selected"] for row in rows())
+
+app.open_entry(2)
+assert app.editing_id is None and app.screen_manager.current == "list"
+app.open_entry(4)
+assert app.editing_id == 4 and app.screen_manager.current == "form"
+assert app.form_screen.form.ids.first_name.text == "Ann3"
+app.delete_current_entry()
+assert app.editing_id is None and app.screen_manager.current == "list"
+assert [row["entry_id"] for row in rows()] == [1, 5]
+
+assert app._compaction_event is not None
+for _ in range(10):
+	if app._compaction_event is None:
+		break
+	Clock.tick()
+assert app._compaction_event is None
+assert app.entries.tombstones == 0 and app.entries.capacity == 2
+assert [row["entry_id"] for row in rows()] == [1, 5]
+app.open_entry(5)
+assert app.form_screen.form.ids.first_name.text == "Ann4"
+print("{MARKER}")
+"""
+
+HISTORY_VIEW = BUILD_APP + f"""
+app.handle_form_submit(payload("Ann"))
+app.open_entry(1)
+app.handle_form_submit(payload("Anna", genders_selected=["Man/boy", "Non-binary"]))
+app.open_entry(1)
+app.open_history()
+assert app.screen_manager.current == "history"
+assert app.history_screen.title == "Anna Lee"
+data = app.history_screen.ids.versions_rv.data
+assert [row["version"] for row in data] == [1, 0]
+assert data[0]["text"].startswith("v2 ") and data[0]["text"].endswith("first_name, genders_selected")
+assert data[1]["text"].startswith("v1 ") and data[1]["text"].endswith("created")
+app.show_history_version(0)
+detail = app.history_screen.detail.splitlines()
+assert detail[0] == "Version 1" and "first_name: Ann" in detail and "genders_selected: Man/boy" in detail
+app.show_history_version(1)
+detail = app.history_screen.detail.splitlines()
+assert detail[0] == "Version 2" and "first_name: Anna" in detail
+assert "genders_selected: Man/boy, Non-binary" in detail
+app.close_history()
+assert app.screen_manager.current == "form" and app.editing_id == 1
+print("{MARKER}")
+"""
+
+
+def run_kivy_snippet(code: str) -> subprocess.CompletedProcess:
+	env = dict(os.environ, KIVY_NO_ARGS="1", KIVY_NO_CONSOLELOG="1")
+	# config_kivy() exits once after it stores the device density, so allow one retry.
+	for _ in range(2):
+		completed = subprocess.run(
+			[sys.executable, "-c", code], cwd=ROOT, env=env, capture_output=True, text=True, timeout=120
+		)
+		if MARKER in completed.stdout or completed.returncode != 0:
+			break
+	return completed
+
+
+def test_demographics_form_builds():
+	completed = run_kivy_snippet(BUILD_FORM)
+	assert MARKER in completed.stdout, completed.stderr[-2000:]
+
+
+def test_delete_entries_through_selection():
+	completed = run_kivy_snippet(DELETE_ENTRIES)
+	assert MARKER in completed.stdout, completed.stderr[-2000:]
+
+
+def test_history_view_lists_versions():
+	completed = run_kivy_snippet(HISTORY_VIEW)
+	assert MARKER in completed.stdout, completed.stderr[-2000:]
@@ -0,0 +1,115 @@
+import io
+import json
+import threading
+import time
+
+from submission_log import REDACTED, RotatingFileSink, StreamSink, SubmissionLogger, redact
+
+
+class StalledSink:
+	"""Blocks every write until released."""
+
+	def __init__(self):
+		self.release = threading.Event()
+		self.closed = False
+
+	def write_batch(self, lines):
+		self.release.wait()
+
+	def close(self):
+		self.closed = True
+
+
+def read(path):
+	with open(path, encoding="utf-8") as handle:
+		return handle.read()
+
+
+def test_rotating_sink_rotates_and_discards_oldest(tmp_path):
+	path = str(tmp_path / "submits.log")
+	sink = RotatingFileSink(path, max_bytes=10, backup_count=2)
+	for idx in range(4):
+		sink.write_batch([f"record-{idx}\n"])
+	sink.close()
+	assert read(path) == "record-3\n"
+	assert read(path + ".1") == "record-2\n"
+	assert read(path + ".2") == "record-1\n"
+	assert not (tmp_path / "submits.log.3").exists()
+
+
+def test_rotating_sink_appends_until_limit(tmp_path):
+	path = str(tmp_path / "submits.log")
+	sink = RotatingFileSink(path, max_bytes=20, backup_count=1)
+	sink.write_batch(["a" * 9 + "\n"])
+	sink.write_batch(["b" * 9 + "\n"])
+	sink.write_batch(["c\n"])
+	sink.close()
+	assert read(path) == "c\n"
+	assert read(path + ".1") == "a" * 9 + "\n" + "b" * 9 + "\n"
+
+
+def test_rotating_sink_picks_up_existing_file_size(tmp_path):
+	path = tmp_path / "submits.log"
+	path.write_text("x" * 15 + "\n", encoding="utf-8")
+	sink = RotatingFileSink(str(path), max_bytes=20, backup_count=1)
+	sink.write_batch(["record\n"])
+	sink.close()
+	assert read(str(path)) == "record\n"
+	assert read(str(path) + ".1") == "x" * 15 + "\n"
+
+
+def test_rotating_sink_without_backups_truncates(tmp_path):
+	path = str(tmp_path / "submits.log")
+	sink = RotatingFileSink(path, max_bytes=10, backup_count=0)
+	sink.write_batch(["record-0\n"])
+	sink.write_batch(["record-1\n"])
+	sink.close()
+	assert read(path) == "record-1\n"
+	assert [item.name for item in tmp_path.iterdir()] == ["submits.log"]
+
+
+def test_redact():
+	payload = {"first_name": "Ann", "phone_number": "(555) 123-4567"}
+	assert redact(payload, ["phone_number", "missing"]) == {"first_name": "Ann", "phone_number": REDACTED}
+	assert payload["phone_number"] == "(555) 123-4567"
+
+
+def test_logger_writes_redacted_json_lines():
+	stream = io.StringIO()
+	logger = SubmissionLogger(StreamSink(stream), flush_interval=0.01)
+	logger.start()
+	assert logger.log("submit", {"first_name": "Ann", "phone_number": "5551234567"}, entry_id=1, version=0)
+	assert logger.log("delete", entry_ids=[1])
+	assert logger.close(timeout=5)
+	records = [json.loads(line) for line in stream.getvalue().splitlines()]
+	assert [record["event"] for record in records] == ["submit", "delete"]
+	assert records[0]["payload"] == {"first_name": "Ann", "phone_number": REDACTED}
+	assert records[0]["entry_id"] == 1 and records[0]["version"] == 0
+	assert records[1]["entry_ids"] == [1]
+	assert not logger.log("submit", {})
+	assert logger.dropped == 1
+
+
+def test_full_queue_drops_without_blocking():
+	sink = StalledSink()
+	logger = SubmissionLogger(sink, max_queue=4, batch_size=1)
+	logger.start()
+	start = time.perf_counter()
+	results = [logger.log("submit", {"idx": idx}) for idx in range(20)]
+	assert time.perf_counter() - start < 1
+	assert results.count(False) == logger.dropped >= 15
+	sink.release.set()
+	assert logger.close(timeout=5)
+
+
+def test_close_is_bounded_when_sink_stalls():
+	sink = StalledSink()
+	logger = SubmissionLogger(sink, max_queue=4)
+	logger.start()
+	for idx in range(20):
+		logger.log("submit", {"idx": idx})
+	start = time.perf_counter()
+	assert not logger.close(timeout=0.2)
+	assert time.perf_counter() - start < 1
+	assert not sink.closed
+	sink.release.set()